@@ -25,6 +25,7 @@ from .core import (
 from .random_component import RandomComponent
 
 make = ElectricMotorEnvironment.make
+make_vec = ElectricMotorEnvironment.make_vec
 
 
 # Add all superclasses of the modules to the registry.
@@ -39,6 +39,8 @@ class LimitConstraint(Constraint):
 
     For all :math:`i` in the set of PhysicalSystems states :math:`S`.
 
+    If the observed states lie next to each other in the state array (e.g. the currents of the DC motors), they are read
+    as a view of the state without copying them.
     """
 
     def __init__(self, observed_state_names="all_states"):
@@ -51,10 +53,11 @@ class LimitConstraint(Constraint):
         self._observed_state_names = observed_state_names
         self._limits = None
         self._observed_states = None
+        self._observed_view = None
 
     def __call__(self, state):
-        observed = state[self._observed_states]
-        violation = any(abs(observed) > 1.0)
+        observed = state[self._observed_view]
+        violation = abs(observed).max(initial=0.0) > 1.0
         return float(violation)
 
     def set_modules(self, ps):
@@ -66,6 +69,12 @@ class LimitConstraint(Constraint):
         self._observed_states = set_state_array(dict.fromkeys(self._observed_state_names, 1), ps.state_names).astype(
             bool
         )
+        indices = np.flatnonzero(self._observed_states)
+        if len(indices) > 0 and indices[-1] - indices[0] + 1 == len(indices):
+            # Contiguous states are accessed by a slice that returns a view of the state array
+            self._observed_view = slice(indices[0], indices[-1] + 1)
+        else:
+            self._observed_view = indices
 
 
 class SquaredConstraint(Constraint):
@@ -76,6 +85,9 @@ class SquaredConstraint(Constraint):
         1.0 <= \sum_{i \in S} (s_i / s_{i,max})^2
 
     :math:`S`: Set of the observed PhysicalSystems states
+
+    The observed states are resolved to an index once in set_modules. As the sum does not depend on the order of the
+    states, states that lie next to each other in the state array (e.g. i_sd and i_sq) are read as a view.
     """
 
     def __init__(self, states=()):
@@ -89,10 +101,14 @@ class SquaredConstraint(Constraint):
         self._normalized = False
 
     def set_modules(self, ps):
-        self._state_indices = [ps.state_positions[state] for state in self._states]
-        self._limits = ps.limits[self._state_indices]
-        self._normalized = not np.all(ps.state_space.high[self._state_indices] == self._limits)
+        indices = np.sort(np.array([ps.state_positions[state] for state in self._states], dtype=np.intp))
+        self._limits = ps.limits[indices]
+        self._normalized = not np.all(ps.state_space.high[indices] == self._limits)
+        if len(indices) > 0 and np.all(np.diff(indices) == 1):
+            self._state_indices = slice(indices[0], indices[-1] + 1)
+        else:
+            self._state_indices = indices
 
     def __call__(self, state):
         state_ = state[self._state_indices] if self._normalized else state[self._state_indices] / self._limits
-        return float(np.sum(state_**2) > 1.0)
+        return float(state_ @ state_ > 1.0)
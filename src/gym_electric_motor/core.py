@@ -205,6 +205,7 @@ class ElectricMotorEnvironment(gymnasium.core.Env):
         constraints=(),
         physical_system_wrappers=(),
         scale_plots=False,
+        observation_dtype=None,
         **kwargs,
     ):
         """
@@ -228,6 +229,8 @@ class ElectricMotorEnvironment(gymnasium.core.Env):
             physical_system_wrappers(iterable(PhysicalSystemWrapper)): PhysicalSystemWrapper instances to be wrapped around
                 the physical system.
             callbacks(list(Callback)): Callbacks being called in the environment
+            observation_dtype(np.dtype/None): Floating point type of the observations and the observation space.
+                The physical system is still simulated in double precision. Default: None (no conversion)
             **kwargs: Arguments to be passed to the modules.
         """
 
@@ -272,10 +275,28 @@ class ElectricMotorEnvironment(gymnasium.core.Env):
         # Initialization of the state filter and the spaces
         state_filter = state_filter or self._physical_system.state_names
         self.state_filter = [self._physical_system.state_names.index(s) for s in state_filter]
+        # Indexing with an integer array avoids the conversion of the list in every step
+        self._state_filter_idx = np.array(self.state_filter, dtype=np.intp)
+        # Without filtering, the conversion into the observation dtype already copies the full state
+        self._full_state_observation = self.state_filter == list(range(len(self._physical_system.state_names)))
         states_low = self._physical_system.state_space.low[self.state_filter]
         states_high = self._physical_system.state_space.high[self.state_filter]
-        state_space = Box(states_low, states_high, dtype=np.float64)
-        self.observation_space = gymnasium.spaces.Tuple((state_space, self._reference_generator.reference_space))
+        self._observation_dtype = None if observation_dtype is None else np.dtype(observation_dtype)
+        reference_space = self._reference_generator.reference_space
+        if self._observation_dtype is None:
+            state_space = Box(states_low, states_high, dtype=np.float64)
+        else:
+            state_space = Box(
+                states_low.astype(self._observation_dtype),
+                states_high.astype(self._observation_dtype),
+                dtype=self._observation_dtype,
+            )
+            reference_space = Box(
+                reference_space.low.astype(self._observation_dtype),
+                reference_space.high.astype(self._observation_dtype),
+                dtype=self._observation_dtype,
+            )
+        self.observation_space = gymnasium.spaces.Tuple((state_space, reference_space))
         self.action_space = self.physical_system.action_space
         self.reward_range = self._reward_function.reward_range
         # new API splits done into two attributes
@@ -291,6 +312,24 @@ class ElectricMotorEnvironment(gymnasium.core.Env):
     def make(env_id, *args, **kwargs):
         return gymnasium.make(env_id, *args, **kwargs)
 
+    def make_vec(env_id, num_envs=1, vectorization_mode="sync", **kwargs):
+        """Creates a gymnasium vector environment of independent instances of a registered environment.
+
+        The observations, rewards and flags of all instances are returned batched along the first axis and
+        terminated instances are reset automatically.
+
+        Args:
+            env_id(str): Id of the registered environment (e.g. ``'Finite-CC-SeriesDc-v0'``).
+            num_envs(int): Number of environment instances. Default: 1
+            vectorization_mode(str): ``'sync'`` to step the instances one after another in this process or
+                ``'async'`` to step each instance in its own subprocess. Default: ``'sync'``
+            kwargs(dict): Further arguments of gymnasium.make_vec and of the environments' constructor.
+
+        Returns:
+            gymnasium.vector.VectorEnv: The vectorized environment.
+        """
+        return gymnasium.make_vec(env_id, num_envs=num_envs, vectorization_mode=vectorization_mode, **kwargs)
+
     def _call_callbacks(self, func_name, *args):
         """Calls each callback's func_name function with *args"""
         for callback in self._callbacks:
@@ -314,7 +353,7 @@ class ElectricMotorEnvironment(gymnasium.core.Env):
         self._reward_function.reset(state, reference)
         self._call_callbacks("on_reset_end", state, reference)
 
-        observation = (state[self.state_filter], next_ref)
+        observation = self._observation(state, next_ref)
         info = {}
         return observation, info
 
@@ -363,13 +402,21 @@ class ElectricMotorEnvironment(gymnasium.core.Env):
 
         info = {}
         return (
-            (state[self.state_filter], ref_next),
+            self._observation(state, ref_next),
             reward,
             self._terminated,
             self._truncated,
             info,
         )
 
+    def _observation(self, state, reference):
+        """Builds the observation from the filtered state and the next reference in the observation dtype."""
+        if self._observation_dtype is None:
+            return state[self._state_filter_idx], reference
+        if not self._full_state_observation:
+            state = state[self._state_filter_idx]
+        return state.astype(self._observation_dtype), np.asarray(reference).astype(self._observation_dtype)
+
     def _seed(self, seed=None):
         sg = np.random.SeedSequence(seed)
         components = [
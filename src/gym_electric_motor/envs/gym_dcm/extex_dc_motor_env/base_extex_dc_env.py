@@ -0,0 +1,156 @@
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable
+
+import numpy as np
+
+from gym_electric_motor import physical_systems as ps
+from gym_electric_motor.core import (
+    ElectricMotorEnvironment,
+    ElectricMotorVisualization,
+    ReferenceGenerator,
+    RewardFunction,
+)
+from gym_electric_motor.physical_systems.physical_systems import DcMotorSystem
+from gym_electric_motor.reference_generators import BatchedWienerProcessReferenceGenerator
+from gym_electric_motor.reward_functions import WeightedSumOfErrors
+from gym_electric_motor.utils import initialize
+from gym_electric_motor.visualization import MotorDashboard
+
+
+@dataclass(frozen=True)
+class ExtExDcEnvSpec:
+    """Defaults of an externally excited DC motor speed or torque control environment.
+
+    The factories are only called for the components that are not specified by the user.
+    """
+
+    #: Default duration of one control step in seconds
+    tau: float
+    #: Factory of the default power electronic converter
+    converter: Callable
+    #: Factory of the default mechanical load
+    load: Callable
+    #: Factory of the default ode solver
+    ode_solver: Callable
+    #: Name of the state to be referenced, rewarded and plotted
+    reference_state: str
+    #: Factory of the default voltage supply
+    supply: Callable = partial(ps.IdealVoltageSupply, u_nominal=60.0)
+    #: Factory of the default electric motor
+    motor: Callable = ps.DcExternallyExcitedMotor
+    #: Factory of the default ode solver, if the mechanical load is a ConstantSpeedLoad. None: Use ode_solver.
+    constant_speed_ode_solver: Callable = None
+
+
+class ExtExDcSpecEnv(ElectricMotorEnvironment):
+    """Base class of the externally excited DC motor speed and torque control environments.
+
+    The environments only differ in their defaults that are set in the class attribute SPEC.
+    """
+
+    #: Defaults of the environment
+    SPEC: ExtExDcEnvSpec = None
+
+    def __init__(
+        self,
+        supply=None,
+        converter=None,
+        motor=None,
+        load=None,
+        ode_solver=None,
+        reward_function=None,
+        reference_generator=None,
+        visualization=None,
+        state_filter=None,
+        callbacks=(),
+        constraints=("i_a", "i_e"),
+        calc_jacobian=True,
+        tau=None,
+        physical_system_wrappers=(),
+        observation_dtype=None,
+        **kwargs,
+    ):
+        """
+        Args:
+            supply(env-arg): Specification of the :py:class:`.VoltageSupply` for the environment
+            converter(env-arg): Specification of the :py:class:`.PowerElectronicConverter` for the environment
+            motor(env-arg): Specification of the :py:class:`.ElectricMotor` for the environment
+            load(env-arg): Specification of the :py:class:`.MechanicalLoad` for the environment
+            ode_solver(env-arg): Specification of the :py:class:`.OdeSolver` for the environment
+            reward_function(env-arg): Specification of the :py:class:`.RewardFunction` for the environment
+            reference_generator(env-arg): Specification of the :py:class:`.ReferenceGenerator` for the environment
+            visualization(env-arg): Specification of the :py:class:`.ElectricMotorVisualization` for the environment
+            constraints(iterable(str/Constraint)): All Constraints of the environment. \n
+                - str: A LimitConstraints for states (episode terminates, if the quantity exceeds the limit)
+                 can be directly specified by passing the state name here (e.g. 'i', 'omega') \n
+                - instance of Constraint: More complex constraints (e.g. the SquaredConstraint can be initialized and
+                 passed to the environment.
+            calc_jacobian(bool): Flag, if the jacobian of the environment shall be taken into account during the
+                simulation. This may lead to speed improvements. Default: True
+            tau(float): Duration of one control step in seconds. Default: None (Control Cycle Time of the environment)
+            state_filter(list(str)): List of states that shall be returned to the agent. Default: None (no filter)
+            callbacks(list(Callback)): Callbacks for user interaction. Default: ()
+            physical_system_wrappers(list(PhysicalSystemWrapper)): List of Physical System Wrappers to modify the
+            actions to and states from the physical system before they are used in the environment. Default: ()
+            observation_dtype(np.dtype/None): Floating point type of the observations (e.g. np.float32). The physical
+                system is still simulated in double precision. Default: None (double precision observations)
+
+        Note on the env-arg type:
+            All parameters of type env-arg can be selected as one of the following types:
+
+            **instance:** Pass an already instantiated object derived from the corresponding base class
+            (e.g. ``reward_function=MyRewardFunction()``). This is directly used in the environment.
+
+            **dict:** Pass a dict to update the default parameters of the default type.
+            (e.g. ``visualization=dict(state_plots=('omega', 'u'))``)
+
+            **str:** Pass a string out of the registered classes to select a different class for the component.
+            This class is then initialized with its default parameters.
+            The available strings can be looked up in the documentation. (e.g. ``converter='Finite-2QC'``)
+        """
+        spec = self.SPEC
+        load = initialize(ps.MechanicalLoad, load, spec.load, dict())
+        default_ode_solver = spec.ode_solver
+        # With a constant speed, the system is linear in its state and solvers for linear systems are exact
+        if spec.constant_speed_ode_solver is not None and isinstance(load, ps.ConstantSpeedLoad):
+            default_ode_solver = spec.constant_speed_ode_solver
+        physical_system = DcMotorSystem(
+            supply=initialize(ps.VoltageSupply, supply, spec.supply, dict()),
+            converter=initialize(ps.PowerElectronicConverter, converter, spec.converter, dict()),
+            motor=initialize(ps.ElectricMotor, motor, spec.motor, dict()),
+            load=load,
+            ode_solver=initialize(ps.OdeSolver, ode_solver, default_ode_solver, dict()),
+            calc_jacobian=calc_jacobian,
+            tau=spec.tau if tau is None else tau,
+        )
+        reference_generator = initialize(
+            ReferenceGenerator,
+            reference_generator,
+            BatchedWienerProcessReferenceGenerator,
+            dict(reference_state=spec.reference_state),
+        )
+        reward_function = initialize(
+            RewardFunction,
+            reward_function,
+            WeightedSumOfErrors,
+            dict(reward_weights={spec.reference_state: 1.0}),
+        )
+        visualization = initialize(
+            ElectricMotorVisualization,
+            visualization,
+            MotorDashboard,
+            dict(state_plots=(spec.reference_state,), action_plots="all", dtype=np.float32),
+        )
+        super().__init__(
+            physical_system=physical_system,
+            reference_generator=reference_generator,
+            reward_function=reward_function,
+            constraints=constraints,
+            visualization=visualization,
+            state_filter=state_filter,
+            callbacks=callbacks,
+            physical_system_wrappers=physical_system_wrappers,
+            observation_dtype=observation_dtype,
+            **kwargs,
+        )
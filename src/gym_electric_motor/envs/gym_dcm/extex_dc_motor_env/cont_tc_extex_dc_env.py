@@ -1,18 +1,11 @@
+from functools import partial
+
 from gym_electric_motor import physical_systems as ps
-from gym_electric_motor.core import (
-    ElectricMotorEnvironment,
-    ElectricMotorVisualization,
-    ReferenceGenerator,
-    RewardFunction,
-)
-from gym_electric_motor.physical_systems.physical_systems import DcMotorSystem
-from gym_electric_motor.reference_generators import WienerProcessReferenceGenerator
-from gym_electric_motor.reward_functions import WeightedSumOfErrors
-from gym_electric_motor.utils import initialize
-from gym_electric_motor.visualization import MotorDashboard
-
-
-class ContTorqueControlDcExternallyExcitedMotorEnv(ElectricMotorEnvironment):
+
+from .base_extex_dc_env import ExtExDcEnvSpec, ExtExDcSpecEnv
+
+
+class ContTorqueControlDcExternallyExcitedMotorEnv(ExtExDcSpecEnv):
     """
     Description:
         Environment to simulate a continuous control set torque controlled externally excited DC Motor
@@ -25,9 +18,10 @@ class ContTorqueControlDcExternallyExcitedMotorEnv(ElectricMotorEnvironment):
         - Converter: :py:class:`.ContMultiConverter` ( 2 x :py:class:`.ContFourQuadrantConverter`)
         - Motor: :py:class:`.DcExternallyExcitedMotor`
         - Load: :py:class:`.ConstantSpeedLoad`
-        - Ode-Solver: :py:class:`.EulerSolver`
+        - Ode-Solver: :py:class:`.ZOHDiscreteSolver` (:py:class:`.ScipyOdeSolver`, if another load than the
+          :py:class:`.ConstantSpeedLoad` is passed)
 
-        - Reference Generator: :py:class:`.WienerProcessReferenceGenerator` *Reference Quantity:* ``'torque'``
+        - Reference Generator: :py:class:`.BatchedWienerProcessReferenceGenerator` *Reference Quantity:* ``'torque'``
 
         - Reward Function: :py:class:`.WeightedSumOfErrors` reward_weights: ``'torque' = 1.0``
 
@@ -87,107 +81,14 @@ class ContTorqueControlDcExternallyExcitedMotorEnv(ElectricMotorEnvironment):
         >>>     (state, reference), reward, terminated, truncated, _ = env.step(env.action_space.sample())
     """
 
-    def __init__(
-        self,
-        supply=None,
-        converter=None,
-        motor=None,
-        load=None,
-        ode_solver=None,
-        reward_function=None,
-        reference_generator=None,
-        visualization=None,
-        state_filter=None,
-        callbacks=(),
-        constraints=(
-            "i_a",
-            "i_e",
-        ),
-        calc_jacobian=True,
+    SPEC = ExtExDcEnvSpec(
         tau=1e-4,
-        physical_system_wrappers=(),
-        **kwargs,
-    ):
-        """
-        Args:
-            supply(env-arg): Specification of the :py:class:`.VoltageSupply` for the environment
-            converter(env-arg): Specification of the :py:class:`.PowerElectronicConverter` for the environment
-            motor(env-arg): Specification of the :py:class:`.ElectricMotor` for the environment
-            load(env-arg): Specification of the :py:class:`.MechanicalLoad` for the environment
-            ode_solver(env-arg): Specification of the :py:class:`.OdeSolver` for the environment
-            reward_function(env-arg): Specification of the :py:class:`.RewardFunction` for the environment
-            reference_generator(env-arg): Specification of the :py:class:`.ReferenceGenerator` for the environment
-            visualization(env-arg): Specification of the :py:class:`.ElectricMotorVisualization` for the environment
-            constraints(iterable(str/Constraint)): All Constraints of the environment. \n
-                - str: A LimitConstraints for states (episode terminates, if the quantity exceeds the limit)
-                 can be directly specified by passing the state name here (e.g. 'i', 'omega') \n
-                - instance of Constraint: More complex constraints (e.g. the SquaredConstraint can be initialized and
-                 passed to the environment.
-            calc_jacobian(bool): Flag, if the jacobian of the environment shall be taken into account during the
-                simulation. This may lead to speed improvements. Default: True
-            tau(float): Duration of one control step in seconds. Default: 1e-4.
-            state_filter(list(str)): List of states that shall be returned to the agent. Default: None (no filter)
-            callbacks(list(Callback)): Callbacks for user interaction. Default: ()
-            physical_system_wrappers(list(PhysicalSystemWrapper)): List of Physical System Wrappers to modify the
-            actions to and states from the physical system before they are used in the environment. Default: ()
-
-        Note on the env-arg type:
-            All parameters of type env-arg can be selected as one of the following types:
-
-            **instance:** Pass an already instantiated object derived from the corresponding base class
-            (e.g. ``reward_function=MyRewardFunction()``). This is directly used in the environment.
-
-            **dict:** Pass a dict to update the default parameters of the default type.
-            (e.g. ``visualization=dict(state_plots=('omega', 'u'))``)
-
-            **str:** Pass a string out of the registered classes to select a different class for the component.
-            This class is then initialized with its default parameters.
-            The available strings can be looked up in the documentation. (e.g. ``converter='Finite-2QC'``)
-        """
-        default_subconverters = (
-            ps.ContFourQuadrantConverter(),
-            ps.ContFourQuadrantConverter(),
-        )
-        physical_system = DcMotorSystem(
-            supply=initialize(ps.VoltageSupply, supply, ps.IdealVoltageSupply, dict(u_nominal=60.0)),
-            converter=initialize(
-                ps.PowerElectronicConverter,
-                converter,
-                ps.ContMultiConverter,
-                dict(subconverters=default_subconverters),
-            ),
-            motor=initialize(ps.ElectricMotor, motor, ps.DcExternallyExcitedMotor, dict()),
-            load=initialize(ps.MechanicalLoad, load, ps.ConstantSpeedLoad, dict(omega_fixed=100.0)),
-            ode_solver=initialize(ps.OdeSolver, ode_solver, ps.ScipyOdeSolver, dict()),
-            calc_jacobian=calc_jacobian,
-            tau=tau,
-        )
-        reference_generator = initialize(
-            ReferenceGenerator,
-            reference_generator,
-            WienerProcessReferenceGenerator,
-            dict(reference_state="torque"),
-        )
-        reward_function = initialize(
-            RewardFunction,
-            reward_function,
-            WeightedSumOfErrors,
-            dict(reward_weights=dict(torque=1.0)),
-        )
-        visualization = initialize(
-            ElectricMotorVisualization,
-            visualization,
-            MotorDashboard,
-            dict(state_plots=("torque",), action_plots="all"),
-        )
-        super().__init__(
-            physical_system=physical_system,
-            reference_generator=reference_generator,
-            reward_function=reward_function,
-            constraints=constraints,
-            visualization=visualization,
-            state_filter=state_filter,
-            callbacks=callbacks,
-            physical_system_wrappers=physical_system_wrappers,
-            **kwargs,
-        )
+        converter=partial(
+            ps.ContMultiConverter,
+            subconverters=(ps.ContFourQuadrantConverter, ps.ContFourQuadrantConverter),
+        ),
+        load=partial(ps.ConstantSpeedLoad, omega_fixed=100.0),
+        ode_solver=ps.ScipyOdeSolver,
+        constant_speed_ode_solver=ps.ZOHDiscreteSolver,
+        reference_state="torque",
+    )
@@ -7,8 +7,8 @@ from gym_electric_motor.core import (
 )
 from gym_electric_motor.physical_systems.physical_systems import DcMotorSystem
 from gym_electric_motor.reference_generators import (
+    BatchedWienerProcessReferenceGenerator,
     MultipleReferenceGenerator,
-    WienerProcessReferenceGenerator,
 )
 from gym_electric_motor.reward_functions import WeightedSumOfErrors
 from gym_electric_motor.utils import initialize
@@ -30,7 +30,7 @@ class FiniteCurrentControlDcExternallyExcitedMotorEnv(ElectricMotorEnvironment):
         - Load: :py:class:`.ConstantSpeedLoad`
         - Ode-Solver: :py:class:`.EulerSolver`
 
-        - Reference Generator: :py:class:`.WienerProcessReferenceGenerator` *Reference Quantity:* ``'i_a', 'i_e'``
+        - Reference Generator: :py:class:`.BatchedWienerProcessReferenceGenerator` *Reference Quantity:* ``'i_a', 'i_e'``
 
         - Reward Function: :py:class:`.WeightedSumOfErrors` reward_weights: ``'i_a' = 0.5, 'i_e' = 0.5``
 
@@ -144,10 +144,8 @@ class FiniteCurrentControlDcExternallyExcitedMotorEnv(ElectricMotorEnvironment):
             This class is then initialized with its default parameters.
             The available strings can be looked up in the documentation. (e.g. ``converter='Finite-2QC'``)
         """
-        default_subconverters = (
-            ps.FiniteFourQuadrantConverter(),
-            ps.FiniteFourQuadrantConverter(),
-        )
+        # The subconverters are instantiated by the multi converter, so they are only created for the default converter
+        default_subconverters = (ps.FiniteFourQuadrantConverter, ps.FiniteFourQuadrantConverter)
         physical_system = DcMotorSystem(
             supply=initialize(ps.VoltageSupply, supply, ps.IdealVoltageSupply, dict(u_nominal=60.0)),
             converter=initialize(
@@ -162,10 +160,14 @@ class FiniteCurrentControlDcExternallyExcitedMotorEnv(ElectricMotorEnvironment):
             calc_jacobian=calc_jacobian,
             tau=tau,
         )
-        sub_generators = (
-            WienerProcessReferenceGenerator(reference_state="i_a"),
-            WienerProcessReferenceGenerator(reference_state="i_e"),
-        )
+        if isinstance(reference_generator, ReferenceGenerator):
+            # The default sub generators are not needed for a passed reference generator
+            sub_generators = ()
+        else:
+            sub_generators = (
+                BatchedWienerProcessReferenceGenerator(reference_state="i_a"),
+                BatchedWienerProcessReferenceGenerator(reference_state="i_e"),
+            )
         reference_generator = initialize(
             ReferenceGenerator,
             reference_generator,
@@ -25,7 +25,7 @@ class FiniteSpeedControlDcSeriesMotorEnv(ElectricMotorEnvironment):
         - Converter: :py:class:`.FiniteFourQuadrantConverter`
         - Motor: :py:class:`.DcSeriesMotor`
         - Load: :py:class:`.PolynomialStaticLoad`
-        - Ode-Solver: :py:class:`.EulerSolver`
+        - Ode-Solver: :py:class:`.ScipyOdeSolver`
 
         - Reference Generator: :py:class:`.WienerProcessReferenceGenerator` *Reference Quantity:* ``'omega'``
 
@@ -25,7 +25,7 @@ class FiniteTorqueControlDcSeriesMotorEnv(ElectricMotorEnvironment):
         - Converter: :py:class:`.FiniteFourQuadrantConverter`
         - Motor: :py:class:`.DcSeriesMotor`
         - Load: :py:class:`.ConstantSpeedLoad`
-        - Ode-Solver: :py:class:`.EulerSolver`
+        - Ode-Solver: :py:class:`.ScipyOdeSolver`
 
         - Reference Generator: :py:class:`.WienerProcessReferenceGenerator` *Reference Quantity:* ``'torque'``
 
@@ -111,6 +111,7 @@ class ContSpeedControlSquirrelCageInductionMotorEnv(ElectricMotorEnvironment):
         constraints=(SquaredConstraint(("i_sq", "i_sd")),),
         calc_jacobian=True,
         tau=1e-4,
+        observation_dtype=None,
         **kwargs,
     ):
         """
@@ -135,6 +136,8 @@ class ContSpeedControlSquirrelCageInductionMotorEnv(ElectricMotorEnvironment):
             callbacks(list(Callback)): Callbacks for user interaction. Default: ()
             physical_system_wrappers(list(PhysicalSystemWrapper)): List of Physical System Wrappers to modify the
             actions to and states from the physical system before they are used in the environment. Default: ()
+            observation_dtype(np.dtype/None): Floating point type of the observations (e.g. np.float32). The physical
+                system is still simulated in double precision. Default: None (double precision observations)
 
         Note on the env-arg type:
             All parameters of type env-arg can be selected as one of the following types:
@@ -191,5 +194,6 @@ class ContSpeedControlSquirrelCageInductionMotorEnv(ElectricMotorEnvironment):
             state_filter=state_filter,
             callbacks=callbacks,
             physical_system_wrappers=physical_system_wrappers,
+            observation_dtype=observation_dtype,
             **kwargs,
         )
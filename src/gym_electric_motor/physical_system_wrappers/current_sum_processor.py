@@ -1,7 +1,7 @@
 import gymnasium
 import numpy as np
 
-from .physical_system_wrapper import PhysicalSystemWrapper
+from .physical_system_wrapper import PhysicalSystemWrapper, state_indexer
 
 
 class CurrentSumProcessor(PhysicalSystemWrapper):
@@ -24,7 +24,7 @@ class CurrentSumProcessor(PhysicalSystemWrapper):
     def set_physical_system(self, physical_system):
         # Docstring of superclass
         super().set_physical_system(physical_system)
-        self._current_indices = [physical_system.state_positions[current] for current in self._currents]
+        self._current_indices = state_indexer(physical_system.state_positions, self._currents)
 
         # Define the new state space as concatenation of the old state space and [-1,1] for i_sum
         low = np.concatenate((physical_system.state_space.low, [-1.0]))
@@ -62,4 +62,4 @@ class CurrentSumProcessor(PhysicalSystemWrapper):
         Returns:
             float: The summation of the currents of the state.
         """
-        return np.sum(state[self._current_indices])
+        return state[self._current_indices].sum()
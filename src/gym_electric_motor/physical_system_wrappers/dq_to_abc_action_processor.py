@@ -77,7 +77,7 @@ class DqToAbcActionProcessor(PhysicalSystemWrapper):
     def simulate(self, action):
         raise NotImplementedError
 
-    def reset(self, **kwargs):
+    def reset(self):
         # Docstring of super class
         normalized_state = self._physical_system.reset()
         self._state = normalized_state * self._physical_system.limits
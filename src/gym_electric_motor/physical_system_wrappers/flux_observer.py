@@ -3,7 +3,7 @@ import numpy as np
 
 import gym_electric_motor as gem
 
-from .physical_system_wrapper import PhysicalSystemWrapper
+from .physical_system_wrapper import PhysicalSystemWrapper, state_indexer
 
 
 class FluxObserver(PhysicalSystemWrapper):
@@ -73,7 +73,7 @@ class FluxObserver(PhysicalSystemWrapper):
         self._state_names = physical_system.state_names + ["psi_abs", "psi_angle"]
         self._state_positions = {key: index for index, key in enumerate(self._state_names)}
 
-        self._i_s_idx = [physical_system.state_positions[name] for name in self._current_names]
+        self._i_s_idx = state_indexer(physical_system.state_positions, self._current_names)
         self._omega_idx = physical_system.state_positions["omega"]
         return self
 
@@ -1,8 +1,29 @@
+import numpy as np
+
 import gym_electric_motor as gem
 
 from ..random_component import RandomComponent
 
 
+def state_indexer(state_positions, state_names):
+    """Resolves state names to an index that selects these states from a state array.
+
+    Consecutive states in ascending order are selected by a slice that returns a view of the state array. Otherwise,
+    an integer index array is returned.
+
+    Args:
+        state_positions(dict): Positions of the states in the state array.
+        state_names(Iterable[string]): Names of the states to select.
+
+    Returns:
+        slice / numpy.ndarray[int]: The index of the states.
+    """
+    indices = np.array([state_positions[name] for name in state_names], dtype=np.intp)
+    if len(indices) > 0 and np.all(indices == np.arange(indices[0], indices[0] + len(indices))):
+        return slice(int(indices[0]), int(indices[0]) + len(indices))
+    return indices
+
+
 class PhysicalSystemWrapper(gem.core.PhysicalSystem, RandomComponent):
     """A PhysicalSystemWrapper is a wrapper around the PhysicalSystem of a gem-environment.
 
@@ -103,6 +124,9 @@ class PhysicalSystemWrapper(gem.core.PhysicalSystem, RandomComponent):
         self._state_names = physical_system.state_names
         self._state_positions = {key: index for index, key in enumerate(self._state_names)}
         self._tau = physical_system.tau
+        if type(self).simulate is PhysicalSystemWrapper.simulate:
+            # Wrappers that do not modify the simulation call the inner system directly
+            self.simulate = physical_system.simulate
         return self
 
     def seed(self, seed=None):
@@ -111,16 +135,23 @@ class PhysicalSystemWrapper(gem.core.PhysicalSystem, RandomComponent):
             self._physical_system.seed(seed)
 
     def __getattr__(self, name):
+        """Forwards the lookup of public attributes that are not defined by the wrapper to the inner physical system.
+
+        Private and special attributes are not forwarded. Copying and unpickling look them up before the inner
+        physical system is set, which would recurse infinitely otherwise.
+        """
+        if name.startswith("_"):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
         return getattr(self._physical_system, name)
 
     def simulate(self, action):
         # Docstring of super class PhysicalSystem
         return self._physical_system.simulate(action)
 
-    def reset(self, **kwargs):
+    def reset(self):
         # Docstring of super class PhysicalSystem
         self.next_generator()
-        return self._physical_system.reset(**kwargs)
+        return self._physical_system.reset()
 
     def __str__(self):
         return "<{}{}>".format(type(self).__name__, self.physical_system)
@@ -1,4 +1,5 @@
 from gym_electric_motor.physical_system_wrappers import PhysicalSystemWrapper
+from gym_electric_motor.physical_system_wrappers.physical_system_wrapper import state_indexer
 
 
 class StateNoiseProcessor(PhysicalSystemWrapper):
@@ -20,6 +21,9 @@ class StateNoiseProcessor(PhysicalSystemWrapper):
 
     """
 
+    #: Distributions of the numpy random generator that are fully described by the parameters loc and scale
+    _LOC_SCALE_DISTRIBUTIONS = ("normal", "laplace", "logistic", "gumbel")
+
     @property
     def random_kwargs(self):
         """Returns the random keyword arguments that are passed through to the random generator function."""
@@ -28,6 +32,12 @@ class StateNoiseProcessor(PhysicalSystemWrapper):
     @random_kwargs.setter
     def random_kwargs(self, value):
         self._random_kwargs = dict(value)
+        self._update_identity()
+
+    @property
+    def is_identity(self):
+        """Returns True, if the processor adds no noise to the states and passes them through unchanged."""
+        return self._identity
 
     def __init__(
         self,
@@ -55,9 +65,10 @@ class StateNoiseProcessor(PhysicalSystemWrapper):
         self._noise = None
         self._states = states
         self._random_dist = random_dist
-        self._state_indices = []
+        self._state_indices = ()
+        self._identity = False
         super().__init__(physical_system)
-        assert hasattr(self._random_generator, random_dist), (
+        assert hasattr(self.random_generator, random_dist), (
             f"The numpy random number generator has no distribution {random_dist}."
             "Check https://numpy.org/doc/stable/reference/random/generator.html#distributions for distributions."
         )
@@ -65,17 +76,22 @@ class StateNoiseProcessor(PhysicalSystemWrapper):
     def set_physical_system(self, physical_system):
         # Docstring from super class
         super().set_physical_system(physical_system)
-        self._state_indices = [physical_system.state_positions[state_name] for state_name in self._states]
+        self._state_indices = state_indexer(physical_system.state_positions, self._states)
+        self._update_identity()
         return self
 
     def reset(self):
         # Docstring from super class
         state = super().reset()
+        if self._identity:
+            return state
         self._new_noise()
         return self._add_noise(state)
 
     def simulate(self, action):
         # Docstring from super class
+        if self._identity:
+            return self._physical_system.simulate(action)
         if self._random_pointer >= self._random_length:
             self._new_noise()
         return self._add_noise(self._physical_system.simulate(action))
@@ -91,8 +107,20 @@ class StateNoiseProcessor(PhysicalSystemWrapper):
         self._random_pointer += 1
         return state
 
+    def _update_identity(self):
+        """Checks, if the configured noise is zero for all steps so that drawing and adding it can be skipped.
+
+        This is the case, if no states are selected or if a location-scale distribution has zero location and scale.
+        """
+        zero_noise = (
+            self._random_dist in self._LOC_SCALE_DISTRIBUTIONS
+            and self._random_kwargs.get("loc", 0.0) == 0.0
+            and self._random_kwargs.get("scale", 1.0) == 0.0
+        )
+        self._identity = len(self._states) == 0 or zero_noise
+
     def _new_noise(self):
         """Samples new noise from the random distribution for the next steps."""
         self._random_pointer = 0
-        fct = getattr(self._random_generator, self._random_dist)
-        self._noise = fct(size=(self._random_length, len(self._state_indices)), **self._random_kwargs)
+        fct = getattr(self.random_generator, self._random_dist)
+        self._noise = fct(size=(self._random_length, len(self._states)), **self._random_kwargs)
@@ -54,10 +54,12 @@ from .physical_systems import (
 )
 from .solvers import (
     EulerSolver,
+    NumbaEulerSolver,
     OdeSolver,
     ScipyOdeIntSolver,
     ScipyOdeSolver,
     ScipySolveIvpSolver,
+    ZOHDiscreteSolver,
 )
 from .voltage_supplies import (
     AC1PhaseSupply,
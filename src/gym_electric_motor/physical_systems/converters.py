@@ -200,8 +200,18 @@ class FiniteConverter(PowerElectronicConverter):
         # Docstring in base class
         super().__init__(tau=tau, **kwargs)
 
+    def _is_valid_action(self, action):
+        """Checks, if the action is an element of the discrete action space.
+
+        Integer actions are compared directly with the bounds of the action space, which is much faster than
+        Discrete.contains. All other actions are left to Discrete.contains.
+        """
+        if type(action) is int or isinstance(action, np.integer):
+            return self.action_space.start <= action < self.action_space.start + self.action_space.n
+        return self.action_space.contains(action)
+
     def set_action(self, action, t):
-        assert self.action_space.contains(
+        assert self._is_valid_action(
             action
         ), f"The selected action {action} is not a valid element of the action space {self.action_space}."
         return super().set_action(action, t)
@@ -333,6 +343,10 @@ class FiniteFourQuadrantConverter(FiniteConverter):
     currents = Box(-1, 1, shape=(1,), dtype=np.float64)
     action_space = Discrete(4)
 
+    #: Output voltage for each action, if there is no interlocking time. The output voltage and the supply current
+    #: (output voltage times output current) are then independent of the current direction. Shared by all instances.
+    _action_voltages = (0.0, 1.0, -1.0, 0.0)
+
     def __init__(self, **kwargs):
         # Docstring in base class
         super().__init__(**kwargs)
@@ -340,6 +354,8 @@ class FiniteFourQuadrantConverter(FiniteConverter):
             FiniteTwoQuadrantConverter(**kwargs),
             FiniteTwoQuadrantConverter(**kwargs),
         ]
+        # Action that determined the switching state during the last conversion via the lookup table
+        self._switching_action = None
 
     def reset(self):
         # Docstring in base class
@@ -349,13 +365,21 @@ class FiniteFourQuadrantConverter(FiniteConverter):
 
     def convert(self, i_out, t):
         # Docstring in base class
+        if self._interlocking_time == 0:
+            self._switching_action = self._current_action
+            return [self._action_voltages[self._current_action]]
         return [self._subconverters[0].convert(i_out, t)[0] - self._subconverters[1].convert([-i_out[0]], t)[0]]
 
     def set_action(self, action, t):
         # Docstring in base class
-        assert self.action_space.contains(
+        assert self._is_valid_action(
             action
         ), f"The selected action {action} is not a valid element of the action space {self.action_space}."
+        self._action_start_time = t
+        self._current_action = action
+        if self._interlocking_time == 0:
+            # The lookup table replaces the subconverters in convert and i_sup, so they do not need the action
+            return [t + self._tau]
         times = []
         action0 = [1, 1, 2, 2][action]
         action1 = [1, 2, 1, 2][action]
@@ -365,6 +389,8 @@ class FiniteFourQuadrantConverter(FiniteConverter):
 
     def i_sup(self, i_out):
         # Docstring in base class
+        if self._interlocking_time == 0 and self._switching_action is not None:
+            return self._action_voltages[self._switching_action] * i_out[0]
         return self._subconverters[0].i_sup(i_out) + self._subconverters[1].i_sup([-i_out[0]])
 
 
@@ -824,7 +850,7 @@ class FiniteB6BridgeConverter(FiniteConverter):
 
     def set_action(self, action, t):
         # Docstring in base class
-        assert self.action_space.contains(
+        assert self._is_valid_action(
             action
         ), f"The selected action {action} is not a valid element of the action space {self.action_space}."
         subactions = self._subactions[action]
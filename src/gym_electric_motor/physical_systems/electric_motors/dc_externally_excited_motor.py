@@ -1,12 +1,35 @@
 import numpy as np
 
+from ...utils import njit
 from .dc_motor import DcMotor
 
 
+@njit(cache=True)
+def _electrical_ode(state, u_in, omega, parameters, derivative):
+    """Compiled electrical ode of the externally excited DC motor. parameters: [r_a, r_e, l_a, l_e, l_e_prime]"""
+    r_a, r_e, l_a, l_e, l_e_prime = parameters[0], parameters[1], parameters[2], parameters[3], parameters[4]
+    i_a = state[0]
+    i_e = state[1]
+    derivative[0] = (u_in[0] - r_a * i_a - l_e_prime * omega * i_e) / l_a
+    derivative[1] = (u_in[1] - r_e * i_e) / l_e
+
+
+@njit(cache=True)
+def _torque(state, parameters):
+    """Compiled torque equation of the externally excited DC motor."""
+    return parameters[4] * state[0] * state[1]
+
+
 class DcExternallyExcitedMotor(DcMotor):
     # Equals DC Base Motor
     HAS_JACOBIAN = True
 
+    def compiled_electrical_ode(self):
+        # Docstring of superclass
+        mp = self._motor_parameter
+        parameters = np.array([mp["r_a"], mp["r_e"], mp["l_a"], mp["l_e"], mp["l_e_prime"]], dtype=np.float64)
+        return _electrical_ode, _torque, parameters
+
     def electrical_jacobian(self, state, u_in, omega, *_):
         mp = self._motor_parameter
         return (
@@ -1,8 +1,23 @@
 import numpy as np
 
+from ...utils import njit
 from .dc_motor import DcMotor
 
 
+@njit(cache=True)
+def _electrical_ode(state, u_in, omega, parameters, derivative):
+    """Compiled electrical ode of the DC series motor. parameters: [r_a + r_e, l_a + l_e, l_e_prime]"""
+    r, l, l_e_prime = parameters[0], parameters[1], parameters[2]
+    i = state[0]
+    derivative[0] = (u_in[0] - r * i - l_e_prime * omega * i) / l
+
+
+@njit(cache=True)
+def _torque(state, parameters):
+    """Compiled torque equation of the DC series motor."""
+    return parameters[2] * state[0] * state[0]
+
+
 class DcSeriesMotor(DcMotor):
     """The DcSeriesMotor is a DcMotor with an armature and exciting circuit connected in series to one input voltage.
 
@@ -75,6 +90,12 @@ class DcSeriesMotor(DcMotor):
         # Docstring of superclass
         return super().torque([currents[self.I_IDX], currents[self.I_IDX]])
 
+    def compiled_electrical_ode(self):
+        # Docstring of superclass
+        mp = self._motor_parameter
+        parameters = np.array([mp["r_a"] + mp["r_e"], mp["l_a"] + mp["l_e"], mp["l_e_prime"]], dtype=np.float64)
+        return _electrical_ode, _torque, parameters
+
     def electrical_ode(self, state, u_in, omega, *_):
         # Docstring of superclass
         return np.matmul(
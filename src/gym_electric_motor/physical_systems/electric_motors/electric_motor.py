@@ -176,6 +176,22 @@ class ElectricMotor(RandomComponent):
         """
         pass
 
+    def compiled_electrical_ode(self):
+        """
+        Compiled (numba-jittable) counterparts of the electrical ode and the torque equation.
+
+        Overriding this method is optional for each subclass. Solvers like the :py:class:`.NumbaEulerSolver` use the
+        compiled functions to integrate the whole system without calls into the python interpreter.
+
+        Returns:
+            Tuple(function, function, ndarray) or None:
+                [0]: electrical_ode(state, u_in, omega, parameters, derivative) writing the derivatives into derivative
+                [1]: torque(state, parameters) returning the generated torque
+                [2]: Parameters of both functions as float array
+            None is returned, if the motor does not provide compiled functions.
+        """
+        return None
+
     def initialize(self, state_space, state_positions, **__):
         """
         Initializes given state values. Values can be given as a constant or
@@ -229,7 +245,7 @@ class ElectricMotor(RandomComponent):
         # random initialization for each motor state (current, epsilon)
         if random_dist is not None:
             if random_dist == "uniform":
-                initial_value = (upper_bound - lower_bound) * self._random_generator.uniform(
+                initial_value = (upper_bound - lower_bound) * self.random_generator.uniform(
                     size=len(self._initial_states.keys())
                 ) + lower_bound
                 # writing initial values in initial_states dict
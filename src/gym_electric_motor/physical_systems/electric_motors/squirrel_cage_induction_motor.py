@@ -2,9 +2,33 @@ import math
 
 import numpy as np
 
+from ...utils import njit
 from .induction_motor import InductionMotor
 
 
+@njit(cache=True)
+def _electrical_ode(state, u_in, omega, parameters, derivative):
+    """Compiled electrical ode of the squirrel cage induction motor with the stator voltages u_in in alpha/beta.
+
+    parameters: [1 / tau_sig, l_m * r_r / (sigma * l_s * l_r**2), l_m * p / (sigma * l_r * l_s), 1 / (sigma * l_s),
+    l_m / tau_r, 1 / tau_r, p, torque factor]
+    """
+    a, b, c, d = parameters[0], parameters[1], parameters[2], parameters[3]
+    e, f, p = parameters[4], parameters[5], parameters[6]
+    i_salpha, i_sbeta, psi_ralpha, psi_rbeta = state[0], state[1], state[2], state[3]
+    derivative[0] = -a * i_salpha + b * psi_ralpha + c * omega * psi_rbeta + d * u_in[0]
+    derivative[1] = -a * i_sbeta + b * psi_rbeta - c * omega * psi_ralpha + d * u_in[1]
+    derivative[2] = e * i_salpha - f * psi_ralpha - p * omega * psi_rbeta
+    derivative[3] = e * i_sbeta - f * psi_rbeta + p * omega * psi_ralpha
+    derivative[4] = p * omega
+
+
+@njit(cache=True)
+def _torque(state, parameters):
+    """Compiled torque equation of the squirrel cage induction motor."""
+    return parameters[7] * (state[2] * state[1] - state[3] * state[0])
+
+
 class SquirrelCageInductionMotor(InductionMotor):
     """
     =====================  ==========  ============= ===========================================
@@ -128,6 +152,29 @@ class SquirrelCageInductionMotor(InductionMotor):
 
         return super().electrical_ode(state, u_sr_aphabeta, omega, *args)
 
+    def compiled_electrical_ode(self):
+        # Docstring of superclass
+        mp = self._motor_parameter
+        l_s = mp["l_m"] + mp["l_sigs"]
+        l_r = mp["l_m"] + mp["l_sigr"]
+        sigma = (l_s * l_r - mp["l_m"] ** 2) / (l_s * l_r)
+        tau_r = l_r / mp["r_r"]
+        tau_sig = sigma * l_s / (mp["r_s"] + mp["r_r"] * (mp["l_m"] ** 2) / (l_r**2))
+        parameters = np.array(
+            [
+                1 / tau_sig,
+                mp["l_m"] * mp["r_r"] / (sigma * l_s * l_r**2),
+                mp["l_m"] * mp["p"] / (sigma * l_r * l_s),
+                1 / (sigma * l_s),
+                mp["l_m"] / tau_r,
+                1 / tau_r,
+                mp["p"],
+                1.5 * mp["p"] * mp["l_m"] / l_r,
+            ],
+            dtype=np.float64,
+        )
+        return _electrical_ode, _torque, parameters
+
     def _update_limits(self, limit_values={}, nominal_values={}):
         # Docstring of superclass
         voltage_limit = 0.5 * self._limits["u"]
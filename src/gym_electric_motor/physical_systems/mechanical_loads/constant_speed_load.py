@@ -1,8 +1,15 @@
 import numpy as np
 
+from ...utils import njit
 from .mechanical_load import MechanicalLoad
 
 
+@njit(cache=True)
+def _mechanical_ode(t, mechanical_state, torque, parameters, derivative):
+    """Compiled mechanical ode of the constant speed load. The speed does not change."""
+    derivative[0] = 0.0
+
+
 class ConstantSpeedLoad(MechanicalLoad):
     """
     Constant speed mechanical load system which will always set the speed
@@ -44,3 +51,7 @@ class ConstantSpeedLoad(MechanicalLoad):
     def mechanical_jacobian(self, t, mechanical_state, torque):
         # Docstring of superclass
         return self._jacobian_result
+
+    def compiled_mechanical_ode(self):
+        # Docstring of superclass
+        return _mechanical_ode, np.zeros(0)
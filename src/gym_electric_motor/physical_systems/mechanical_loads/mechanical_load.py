@@ -95,6 +95,9 @@ class MechanicalLoad(RandomComponent):
         load_initializer = load_initializer or {}
         self._initializer = self._default_initializer.copy()
         self._initializer.update(load_initializer)
+        if "states" in self._initializer:
+            # Own copy, because the initial states are updated on (random) initializations
+            self._initializer["states"] = dict(self._initializer["states"])
         self._initial_states = self._initializer.get("states", {state: 0.0 for state in self._state_names})
 
     def initialize(self, state_space, state_positions, nominal_state, **__):
@@ -225,6 +228,22 @@ class MechanicalLoad(RandomComponent):
         """
         pass
 
+    def compiled_mechanical_ode(self):
+        """
+        Compiled (numba-jittable) counterpart of the mechanical ode.
+
+        Overriding this method is optional for each subclass. Solvers like the :py:class:`.NumbaEulerSolver` use the
+        compiled function to integrate the whole system without calls into the python interpreter.
+
+        Returns:
+            Tuple(function, ndarray) or None:
+                [0]: mechanical_ode(t, mechanical_state, torque, parameters, derivative) writing the derivatives into
+                derivative
+                [1]: Parameters of the function as float array
+            None is returned, if the load does not provide a compiled function.
+        """
+        return None
+
     def get_state_space(self, omega_range):
         """
         Args:
@@ -1,10 +1,26 @@
 import numpy as np
 
-from gym_electric_motor.utils import update_parameter_dict
+from gym_electric_motor.utils import njit, update_parameter_dict
 
 from .mechanical_load import MechanicalLoad
 
 
+@njit(cache=True)
+def _mechanical_ode(t, mechanical_state, torque, parameters, derivative):
+    """Compiled mechanical ode of the polynomial static load.
+
+    parameters: [a, b, c, j_total, omega_lim, omega_linear_factor]
+    """
+    a, b, c, j_total = parameters[0], parameters[1], parameters[2], parameters[3]
+    omega = mechanical_state[0]
+    sign = 1.0 if omega > 0 else -1.0 if omega < 0 else 0.0
+    if abs(omega) > parameters[4]:
+        a = sign * a
+    else:
+        a = parameters[5] * omega
+    derivative[0] = (torque - (sign * c * omega**2 + b * omega + a)) / j_total
+
+
 class PolynomialStaticLoad(MechanicalLoad):
     """Mechanical system that models the Mechanical-ODE based on a static polynomial load torque.
 
@@ -105,3 +121,10 @@ class PolynomialStaticLoad(MechanicalLoad):
         # Linear region of the constant load term 'a' ?
         a = 0 if abs(omega) > self._a * self.tau_decay / self._j_total else self._j_total / self.tau_decay
         return np.array([[(-self._b - 2 * sign * self._c * omega - a) / self._j_total]]), np.array([1 / self._j_total])
+
+    def compiled_mechanical_ode(self):
+        # Docstring of superclass
+        parameters = np.array(
+            [self._a, self._b, self._c, self._j_total, self._omega_lim, self._omega_linear_factor], dtype=np.float64
+        )
+        return _mechanical_ode, parameters
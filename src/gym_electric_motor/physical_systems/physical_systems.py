@@ -7,7 +7,41 @@ import gym_electric_motor as gem
 
 from ..core import PhysicalSystem
 from ..random_component import RandomComponent
-from ..utils import set_state_array
+from ..utils import njit, set_state_array
+
+
+#: Compiled system equations for each combination of compiled motor and load odes.
+_compiled_system_equations = {}
+
+
+def _compile_system_equation(electrical_ode, torque, mechanical_ode, n_load_states, omega_idx):
+    """
+    Compiles the counterpart of SCMLSystem._system_equation for the passed compiled odes of the motor and the load.
+
+    The compiled functions are closed over, so that calls into them are resolved at compile time. Each combination
+    is compiled only once per process.
+
+    Returns:
+        function: system_equation(t, state, u_in, derivative, motor_parameters, load_parameters) writing the
+        derivatives of the ODE-State into derivative.
+    """
+    key = (electrical_ode, torque, mechanical_ode, n_load_states, omega_idx)
+    if key not in _compiled_system_equations:
+
+        @njit
+        def system_equation(t, state, u_in, derivative, motor_parameters, load_parameters):
+            motor_state = state[n_load_states:]
+            mechanical_ode(
+                t,
+                state[:n_load_states],
+                torque(motor_state, motor_parameters),
+                load_parameters,
+                derivative[:n_load_states],
+            )
+            electrical_ode(motor_state, u_in, state[omega_idx], motor_parameters, derivative[n_load_states:])
+
+        _compiled_system_equations[key] = system_equation
+    return _compiled_system_equations[key]
 
 
 class SCMLSystem(PhysicalSystem, RandomComponent):
@@ -83,6 +117,9 @@ class SCMLSystem(PhysicalSystem, RandomComponent):
         self._mechanical_load.set_j_rotor(self._electrical_motor.motor_parameter["j_rotor"])
         self._t = 0
         self._set_indices()
+        compiled_system_equation = self._build_compiled_system_equation()
+        if compiled_system_equation is not None:
+            self._ode_solver.set_compiled_system_equation(*compiled_system_equation, tau=tau)
         state_space = self._build_state_space(state_names)
         super().__init__(self._converter.action_space, state_space, state_names, tau)
         self._limits = np.zeros_like(state_names, dtype=float)
@@ -160,6 +197,35 @@ class SCMLSystem(PhysicalSystem, RandomComponent):
         voltages_upper = voltages_lower + len(self._electrical_motor.VOLTAGES)
         self.VOLTAGES_IDX = list(range(voltages_lower, voltages_upper))
         self.U_SUP_IDX = list(range(voltages_upper, voltages_upper + self._supply.voltage_len))
+        # Index arrays and slices for simulate. Indexing with lists converts them into arrays on every access.
+        n_load_states = len(self._load_ode_idx)
+        self._ode_currents_array = np.array(self._ode_currents_idx, dtype=np.intp)
+        self._motor_ode_array = np.array(self._motor_ode_idx, dtype=np.intp)
+        self._ode_motor_currents_array = n_load_states + np.array(self._electrical_motor.CURRENTS_IDX, dtype=np.intp)
+        self._load_ode_slice = slice(0, n_load_states)
+        self._currents_slice = slice(currents_lower, currents_upper)
+        self._voltages_slice = slice(voltages_lower, voltages_upper)
+        self._u_sup_slice = slice(voltages_upper, voltages_upper + self._supply.voltage_len)
+
+    def _build_compiled_system_equation(self):
+        """
+        Composes the compiled system equation from the compiled odes of the motor and the load.
+
+        Returns:
+            Tuple(function, tuple) or None: The compiled system equation
+            ``system_equation(t, state, u_in, derivative, *args)`` and its additional arguments ``args``.
+            None is returned, if the motor or the load does not provide compiled odes.
+        """
+        compiled_electrical_ode = self._electrical_motor.compiled_electrical_ode()
+        compiled_mechanical_ode = self._mechanical_load.compiled_mechanical_ode()
+        if compiled_electrical_ode is None or compiled_mechanical_ode is None:
+            return None
+        electrical_ode, torque, motor_parameters = compiled_electrical_ode
+        mechanical_ode, load_parameters = compiled_mechanical_ode
+        system_equation = _compile_system_equation(
+            electrical_ode, torque, mechanical_ode, len(self._load_ode_idx), self._omega_ode_idx
+        )
+        return system_equation, (motor_parameters, load_parameters)
 
     def seed(self, seed=None):
         RandomComponent.seed(self, seed)
@@ -171,7 +237,7 @@ class SCMLSystem(PhysicalSystem, RandomComponent):
     def simulate(self, action, *_, **__):
         # Docstring of superclass
         ode_state = self._ode_solver.y
-        i_in = self._electrical_motor.i_in(ode_state[self._ode_currents_idx])
+        i_in = self._electrical_motor.i_in(ode_state[self._ode_currents_array])
         switching_times = self._converter.set_action(action, self._t)
 
         for t in switching_times[:-1]:
@@ -181,7 +247,7 @@ class SCMLSystem(PhysicalSystem, RandomComponent):
             u_in = [u * u_s for u in u_in for u_s in u_sup]
             self._ode_solver.set_f_params(u_in)
             ode_state = self._ode_solver.integrate(t)
-            i_in = self._electrical_motor.i_in(ode_state[self._ode_currents_idx])
+            i_in = self._electrical_motor.i_in(ode_state[self._ode_currents_array])
 
         i_sup = self._converter.i_sup(i_in)
         u_sup = self._supply.get_voltage(self._t, i_sup)
@@ -191,16 +257,15 @@ class SCMLSystem(PhysicalSystem, RandomComponent):
         ode_state = self._ode_solver.integrate(self._t + self.tau)
         self._t = self._ode_solver.t
         self._k += 1
-        torque = self._electrical_motor.torque(ode_state[self._motor_ode_idx])
-
-        n_mech_states = len(self.mechanical_load.state_names)
-        motor_state = ode_state[n_mech_states:]
-        self.system_state[:n_mech_states] = ode_state[:n_mech_states]
-        self.system_state[self.TORQUE_IDX] = torque
-        self.system_state[self.CURRENTS_IDX] = motor_state[self._electrical_motor.CURRENTS_IDX]
-        self.system_state[self.VOLTAGES_IDX] = u_in
-        self.system_state[self.U_SUP_IDX] = u_sup
-        return self.system_state / self._limits
+        torque = self._electrical_motor.torque(ode_state[self._motor_ode_array])
+
+        system_state = self.system_state
+        system_state[self._load_ode_slice] = ode_state[self._load_ode_slice]
+        system_state[self.TORQUE_IDX] = torque
+        system_state[self._currents_slice] = ode_state[self._ode_motor_currents_array]
+        system_state[self._voltages_slice] = u_in
+        system_state[self._u_sup_slice] = u_sup
+        return system_state / self._limits
 
     def _system_equation(self, t, state, u_in, **__):
         """
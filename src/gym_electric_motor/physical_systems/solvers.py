@@ -1,4 +1,65 @@
+import numpy as np
 from scipy.integrate import ode, odeint, solve_ivp
+from scipy.linalg import expm
+
+from ..utils import NUMBA_AVAILABLE, njit
+
+
+#: Compiled euler integrators for each compiled system equation.
+_euler_integrators = {}
+_fixed_step_euler_integrators = {}
+
+
+def _compile_euler_integrator(system_equation):
+    """
+    Compiles an euler integrator for the passed compiled system equation.
+
+    Returns:
+        function: integrate(t, state, u_in, tau, nsteps, derivative, *args) that performs nsteps euler steps of width
+        tau and updates the state in place.
+    """
+    if system_equation not in _euler_integrators:
+
+        @njit
+        def integrate(t, state, u_in, tau, nsteps, derivative, *args):
+            for _ in range(nsteps):
+                system_equation(t, state, u_in, derivative, *args)
+                for i in range(state.shape[0]):
+                    state[i] += tau * derivative[i]
+                t += tau
+            return state
+
+        _euler_integrators[system_equation] = integrate
+    return _euler_integrators[system_equation]
+
+
+def _compile_fixed_step_euler_integrator(system_equation, tau, nsteps):
+    """
+    Compiles an euler integrator for the passed compiled system equation that is specialized on the time step.
+
+    The step width and the number of steps are frozen into the integrator as compile-time constants. The integrators
+    are shared between all solvers with the same system equation, time step and number of steps.
+
+    Returns:
+        function: integrate(t, state, u_in, derivative, *args) that performs nsteps euler steps of width tau / nsteps
+        and updates the state in place.
+    """
+    key = (system_equation, float(tau), int(nsteps))
+    if key not in _fixed_step_euler_integrators:
+        n = key[2]
+        h = key[1] / n
+
+        @njit
+        def integrate(t, state, u_in, derivative, *args):
+            for _ in range(n):
+                system_equation(t, state, u_in, derivative, *args)
+                for i in range(state.shape[0]):
+                    state[i] += h * derivative[i]
+                t += h
+            return state
+
+        _fixed_step_euler_integrators[key] = integrate
+    return _fixed_step_euler_integrators[key]
 
 
 class OdeSolver:
@@ -16,6 +77,12 @@ class OdeSolver:
     _system_equation = None
     #: System jacobian in the form _system_jacobian(t,y, *f_params)
     _system_jacobian = None
+    #: Compiled system equation in the form _compiled_system_equation(t, y, u_in, derivative, *compiled_args)
+    _compiled_system_equation = None
+    #: Additional arguments of the compiled system equation
+    _compiled_args = ()
+    #: Sampling time of the physical system the compiled system equation belongs to
+    _tau = None
 
     @property
     def t(self):
@@ -66,6 +133,23 @@ class OdeSolver:
         self._system_equation = system_equation
         self._system_jacobian = jac
 
+    def set_compiled_system_equation(self, system_equation, args=(), tau=None):
+        """
+        Setting of a compiled (numba-jittable) counterpart of the systems equation.
+
+        It is passed additionally to the system equation by physical systems that support it. Solvers that cannot make
+        use of it, integrate the system equation set in :py:meth:`set_system_equation`.
+
+        Args:
+            system_equation(function_pointer): Pointer to the compiled systems equation with the parameters
+                (t, y, u_in, derivative, *args). It writes the derivatives of y into derivative.
+            args(tuple): Further constant arguments of the compiled systems equation.
+            tau(float/None): Sampling time of the physical system. Solvers may specialize their integration on it.
+        """
+        self._compiled_system_equation = system_equation
+        self._compiled_args = tuple(args)
+        self._tau = tau
+
     def set_f_params(self, *args):
         """
         Set further arguments for the systems function call like input quantities.
@@ -80,10 +164,10 @@ class EulerSolver(OdeSolver):
     """
     Solves a system of differential equations of first order for a given time step with linear approximation.
 
-        .. math:
+        .. math::
             x^\prime(t) = f(x(t))
 
-        .. math:
+        .. math::
             x(t + \\frac{\\tau}{nsteps}) = x(t) + x^\prime(t) * \\frac{\\tau}{nsteps}
     """
 
@@ -136,6 +220,65 @@ class EulerSolver(OdeSolver):
         return self._y
 
 
+class NumbaEulerSolver(EulerSolver):
+    """
+    Euler solver that integrates the compiled system equation of the physical system in a numba-jitted loop.
+
+    The per step overhead of the python interpreter is removed, which makes it well suited for small time steps.
+    Numba and a compiled system equation (see :py:meth:`OdeSolver.set_compiled_system_equation`) are required for
+    this. Otherwise, the solver falls back to the behavior of the :py:class:`EulerSolver`.
+
+    If the sampling time of the physical system is known, full sampling steps are integrated by a kernel that is
+    specialized on it. Shorter steps (e.g. until a switching time of the converter) use the generic kernel.
+
+    No environment uses this solver by default. Pass it as ``ode_solver`` (e.g.
+    ``gem.make("Finite-SC-ExtExDc-v0", ode_solver=NumbaEulerSolver())``) to opt in.
+    """
+
+    def __init__(self, nsteps=1):
+        # Docstring of superclass
+        super().__init__(nsteps)
+        self._compiled_integrate = None
+        self._compiled_fixed_step_integrate = None
+        self._derivative = None
+
+    def set_compiled_system_equation(self, system_equation, args=(), tau=None):
+        # Docstring of superclass
+        super().set_compiled_system_equation(system_equation, args, tau)
+        self._compiled_fixed_step_integrate = None
+        if NUMBA_AVAILABLE:
+            self._compiled_integrate = _compile_euler_integrator(system_equation)
+            if tau is not None:
+                self._compiled_fixed_step_integrate = _compile_fixed_step_euler_integrator(
+                    system_equation, tau, self._nsteps
+                )
+        self._derivative = None
+
+    def integrate(self, t):
+        # Docstring of superclass
+        if self._compiled_integrate is None:
+            return self._integrate(t)
+        state = np.array(self._y, dtype=np.float64)
+        if self._derivative is None or self._derivative.shape != state.shape:
+            self._derivative = np.zeros_like(state)
+        u_in = np.asarray(self._f_params[0], dtype=np.float64)
+        if self._compiled_fixed_step_integrate is not None and t == self._t + self._tau:
+            self._compiled_fixed_step_integrate(float(self._t), state, u_in, self._derivative, *self._compiled_args)
+        else:
+            self._compiled_integrate(
+                float(self._t),
+                state,
+                u_in,
+                (t - self._t) / self._nsteps,
+                self._nsteps,
+                self._derivative,
+                *self._compiled_args,
+            )
+        self._y = state
+        self._t = t
+        return self._y
+
+
 class ScipyOdeSolver(OdeSolver):
     """
     Wrapper class for all ode-solvers in the scipy.integrate.ode package.
@@ -247,3 +390,86 @@ class ScipyOdeIntSolver(OdeSolver):
         self._t = t
         self._y = result[-1]
         return self._y
+
+
+class ZOHDiscreteSolver(OdeSolver):
+    """
+    Solver that computes the exact zero-order-hold discretization of systems that are affine in their state.
+
+    For an input u that is constant during the step width h and a system equation :math:`x^\\prime = f(x, u)` with a
+    constant jacobian J, the exact solution is
+
+        .. math::
+            x(t + h) = x(t) + h \\varphi_1(h J) f(x(t), u)
+
+    with :math:`\\varphi_1(z) = (e^z - 1) / z`. The transition matrix :math:`h \\varphi_1(h J)` is computed with the
+    matrix exponential from the system jacobian at the initial value of each episode and reused for all steps of the
+    same width. Each step costs only one evaluation of the system equation and one matrix-vector product.
+
+    The solver is exact for linear systems (e.g. the DC motors with a :py:class:`.ConstantSpeedLoad`). For nonlinear
+    systems, the frozen linearization is only an approximation. If the physical system does not provide its jacobian,
+    it is approximated by finite differences.
+    """
+
+    def __init__(self, relinearize=False):
+        """
+        Args:
+            relinearize(bool): Flag, if the transition matrix shall be recomputed from the current jacobian in every
+                step (exponential euler method) for nonlinear systems. Default: False
+        """
+        self._relinearize = relinearize
+        self._transition = None
+        self._h = None
+
+    def set_initial_value(self, initial_value, t=0):
+        # Docstring of superclass
+        super().set_initial_value(initial_value, t)
+        self._transition = None
+
+    def integrate(self, t):
+        # Docstring of superclass
+        h = t - self._t
+        # Step widths that only differ by rounding errors of the system time reuse the transition matrix
+        if self._relinearize or self._transition is None or abs(h - self._h) > 1e-9 * abs(self._h):
+            self._transition = self._compute_transition(h)
+            self._h = h
+        self._y = self._y + self._transition @ self._system_equation(self._t, self._y, *self._f_params)
+        self._t = t
+        return self._y
+
+    def _compute_transition(self, h):
+        """
+        Computes the transition matrix :math:`h \\varphi_1(h J)` from the exponential of an augmented matrix.
+
+        Args:
+            h(float): Step width
+
+        Returns:
+            ndarray(float): The transition matrix.
+        """
+        if self._system_jacobian is not None:
+            jacobian = self._system_jacobian(self._t, self._y, *self._f_params)
+        else:
+            jacobian = self._finite_difference_jacobian()
+        n = jacobian.shape[0]
+        augmented = np.zeros((2 * n, 2 * n))
+        augmented[:n, :n] = jacobian * h
+        augmented[:n, n:] = np.eye(n) * h
+        return expm(augmented)[:n, n:]
+
+    def _finite_difference_jacobian(self):
+        """
+        Approximates the system jacobian at the current state by forward differences.
+
+        Returns:
+            ndarray(float): The approximated jacobian.
+        """
+        y = np.asarray(self._y, dtype=float)
+        f = np.asarray(self._system_equation(self._t, y, *self._f_params), dtype=float).copy()
+        jacobian = np.zeros((len(f), len(y)))
+        for i in range(len(y)):
+            y_shifted = y.copy()
+            delta = np.sqrt(np.finfo(float).eps) * max(1.0, abs(y[i]))
+            y_shifted[i] += delta
+            jacobian[:, i] = (self._system_equation(self._t, y_shifted, *self._f_params) - f) / delta
+        return jacobian
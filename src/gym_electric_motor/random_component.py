@@ -50,16 +50,22 @@ class RandomComponent:
     @property
     def random_generator(self):
         """The random generator that has to be used to draw the random numbers."""
+        if self._random_generator is None:
+            self._random_generator = np.random.default_rng(self.seed_sequence.spawn(1)[0])
         return self._random_generator
 
     @property
     def seed_sequence(self):
         """The base seed sequence that generates the sub generators and sub seeds at every environment reset."""
+        if self._seed_sequence is None:
+            self._seed_sequence = np.random.SeedSequence()
         return self._seed_sequence
 
     def __init__(self):
-        self._seed_sequence = np.random.SeedSequence()
-        self._random_generator = np.random.default_rng(self._seed_sequence.spawn(1)[0])
+        # The environment seeds all its random components at every reset. Therefore, the unseeded seed sequence and
+        # random generator are only created on first use to keep the instantiation of the components cheap.
+        self._seed_sequence = None
+        self._random_generator = None
 
     def seed(self, seed=None):
         """The function to set the seed.
@@ -84,4 +90,4 @@ class RandomComponent:
 
     def next_generator(self):
         """Sets a new reference generator for a new episode."""
-        self._random_generator = np.random.default_rng(self._seed_sequence.spawn(1)[0])
+        self._random_generator = np.random.default_rng(self.seed_sequence.spawn(1)[0])
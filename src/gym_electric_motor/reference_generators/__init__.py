@@ -1,4 +1,5 @@
 from ..core import ReferenceGenerator
+from .batched_wiener_process_reference_generator import BatchedWienerProcessReferenceGenerator
 from .const_reference_generator import ConstReferenceGenerator
 from .laplace_process_reference_generator import LaplaceProcessReferenceGenerator
 from .multiple_reference_generator import MultipleReferenceGenerator
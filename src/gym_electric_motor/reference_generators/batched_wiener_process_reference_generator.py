@@ -0,0 +1,47 @@
+import numpy as np
+
+from .wiener_process_reference_generator import WienerProcessReferenceGenerator
+
+
+class BatchedWienerProcessReferenceGenerator(WienerProcessReferenceGenerator):
+    """Wiener Process Reference Generator that draws the random increments of its sub episodes in large batches.
+
+    The standard normally distributed increments are drawn block-wise into a pool, from which the sub episodes take
+    their increments. The pool is discarded at every reset, so that each episode only depends on its own random
+    generator like in the :py:class:`.WienerProcessReferenceGenerator`.
+
+    Note:
+        Every episode has a fixed cost: the first sub episode after a reset draws ``max(batch_size, sub episode
+        length)`` increments, even if the episode ends earlier. The generator does not know the length of the
+        episode, so it cannot size this block to the remaining steps. For short episodes, use a smaller
+        ``batch_size``. The pool also consumes the random generator differently than the
+        :py:class:`.WienerProcessReferenceGenerator`, so the same seed yields different references.
+    """
+
+    def __init__(self, batch_size=2**14, **kwargs):
+        """
+        Args:
+            batch_size(int): Number of increments that are drawn at once into the pool. At least this many are drawn
+                in every episode.
+            kwargs: Further arguments to pass to the :py:class:`.WienerProcessReferenceGenerator`
+        """
+        assert batch_size > 0, "The batch size has to be positive."
+        super().__init__(**kwargs)
+        self._batch_size = int(batch_size)
+        self._pool = np.zeros(0)
+        self._pool_idx = 0
+
+    def reset(self, initial_state=None, initial_reference=None):
+        # Docstring of superclass
+        self._pool = np.zeros(0)
+        self._pool_idx = 0
+        return super().reset(initial_state, initial_reference)
+
+    def _random_increments(self, sigma, size):
+        # Docstring of superclass
+        if self._pool_idx + size > len(self._pool):
+            self._pool = self.random_generator.standard_normal(max(self._batch_size, size))
+            self._pool_idx = 0
+        increments = self._pool[self._pool_idx : self._pool_idx + size] * sigma
+        self._pool_idx += size
+        return increments
@@ -1,8 +1,39 @@
 import numpy as np
+from gymnasium.spaces import Box
 
+from ..utils import NUMBA_AVAILABLE, njit
 from .subepisoded_reference_generator import SubepisodedReferenceGenerator
 
 
+#: Argument types of the _step_reference kernel for each dtype of the reference. The kernel is compiled for them when
+#: the generator is set up.
+_STEP_REFERENCE_SIGNATURES = {
+    np.dtype(np.float64): "void(f8, f8, f8, f8, i8, f8, f8[::1])",
+    np.dtype(np.float32): "void(f8, f8, f8, f8, i8, f8, f4[::1])",
+}
+
+
+@njit(cache=True)
+def _step_reference(low, high, frequency, high_low_ratio, shift, tau, reference):
+    """Computes the step function between the low and high level and shifts it by shift samples in one pass.
+
+    The time vector equals the np.linspace of the NumPy implementation. The results are written into the reference
+    array.
+    """
+    n = reference.shape[0]
+    # Increment of np.linspace(0, (n - 1) * tau, n)
+    stop = (n - 1) * tau
+    step = stop / (n - 1) if n > 1 else 0.0
+    for i in range(n):
+        t = stop if i == n - 1 else i * step
+        phase = t * frequency
+        phase -= np.floor(phase)
+        j = i + shift
+        if j >= n:
+            j -= n
+        reference[j] = high if phase >= high_low_ratio else low
+
+
 class StepReferenceGenerator(SubepisodedReferenceGenerator):
     """
     Reference Generator that generates a step function with a random amplitude, frequency, phase and offset.
@@ -13,18 +44,27 @@ class StepReferenceGenerator(SubepisodedReferenceGenerator):
     _frequency = 0
     _offset = 0
 
-    def __init__(self, amplitude_range=None, frequency_range=(1, 10), offset_range=None, **kwargs):
+    def __init__(self, amplitude_range=None, frequency_range=(1, 10), offset_range=None, dtype=np.float64, **kwargs):
         """
         Args:
             amplitude_range(tuple(float,float)): Lower and upper limit for the amplitude.
             frequency_range(tuple(float,float)): Lower and upper limit for the frequency.
             offset_range(tuple(float,float)): Lower and upper limit for the offset
+            dtype(np.dtype): Floating point type of the references (np.float64 or np.float32). The step function is
+                computed in double precision and only stored in this type. Single precision halves the memory of the
+                reference buffer. Default: np.float64
             kwargs(any): Arguments passed to the superclass SubepisodedReferenceGenerator .
         """
+        assert np.dtype(dtype) in _STEP_REFERENCE_SIGNATURES, "The dtype has to be np.float64 or np.float32."
         super().__init__(**kwargs)
+        self._dtype = np.dtype(dtype)
         self._amplitude_range = amplitude_range or (0, np.inf)
         self._frequency_range = frequency_range
         self._offset_range = offset_range or (-np.inf, np.inf)
+        # Sample indices as floats to compute the time vector of the NumPy implementation and the buffer that the
+        # references of the sub episodes are written into. Both are allocated for the longest sub episode.
+        self._sample_indices = np.arange(0.0)
+        self._reference_buffer = np.empty(0, dtype=self._dtype)
 
     def set_modules(self, physical_system):
         super().set_modules(physical_system)
@@ -34,27 +74,72 @@ class StepReferenceGenerator(SubepisodedReferenceGenerator):
             (self._limit_margin[1] - self._limit_margin[0]) / 2,
         )
         self._offset_range = np.clip(self._offset_range, self._limit_margin[0], self._limit_margin[1])
+        self.reference_space = Box(
+            self.reference_space.low.astype(self._dtype),
+            self.reference_space.high.astype(self._dtype),
+            dtype=self._dtype,
+        )
+        self._allocate_buffers(int(np.max(self._episode_len_range)))
+        if NUMBA_AVAILABLE:
+            # Compile (or load from the cache) before the first reset instead of within the first episode
+            _step_reference.compile(_STEP_REFERENCE_SIGNATURES[self._dtype])
+
+    def _allocate_buffers(self, length):
+        """Allocates the sample indices and the reference buffer for sub episodes of up to length steps."""
+        self._sample_indices = np.arange(float(length))
+        self._reference_buffer = np.empty(length, dtype=self._dtype)
 
     def _reset_reference(self):
         self._amplitude = self._get_current_value(self._amplitude_range)
         self._frequency = self._get_current_value(self._frequency_range)
-        offset_range = np.clip(
-            self._offset_range,
-            self._limit_margin[0] + self._amplitude,
-            self._limit_margin[1] - self._amplitude,
-        )
+        # Clip the offset range with scalar operations (like np.clip) so that the steps stay within the limit margin
+        offset_min = self._limit_margin[0] + self._amplitude
+        offset_max = self._limit_margin[1] - self._amplitude
+        if np.ndim(self._offset_range) == 0:
+            offset_range = min(max(self._offset_range, offset_min), offset_max)
+        else:
+            offset_range = (
+                min(max(self._offset_range[0], offset_min), offset_max),
+                min(max(self._offset_range[1], offset_min), offset_max),
+            )
         self._offset = self._get_current_value(offset_range)
         high_low_ratio = self.random_generator.triangular(0, 0.5, 1)
-        t = np.linspace(
-            0,
-            (self._current_episode_length - 1) * self._physical_system.tau,
-            self._current_episode_length,
-        )
-        x = self._frequency * (t % (1 / self._frequency))
-        x -= high_low_ratio
-        x = np.sign(x)
         phase = self.random_generator.uniform()
         steps_per_period = 1 / self._frequency / self._physical_system.tau
-        x = np.roll(x, int(steps_per_period * phase))
-        self._reference = self._amplitude * x + self._offset
-        self._reference = np.clip(self._reference, self._limit_margin[0], self._limit_margin[1])
+        k = int(steps_per_period * phase) % self._current_episode_length
+        # Clipping both levels of the step function is equal to clipping the whole reference
+        lower, upper = self._limit_margin
+        high = min(max(self._amplitude + self._offset, lower), upper)
+        low = min(max(-self._amplitude + self._offset, lower), upper)
+        n = self._current_episode_length
+        if n > len(self._reference_buffer):
+            self._allocate_buffers(n)
+        # The reference is a view on the buffer that is overwritten in the next sub episode
+        self._reference = self._reference_buffer[:n]
+        if NUMBA_AVAILABLE:
+            _step_reference(
+                float(low),
+                float(high),
+                float(self._frequency),
+                float(high_low_ratio),
+                k,
+                float(self._physical_system.tau),
+                self._reference,
+            )
+            return
+        # Equal to np.linspace(0, stop, n) without its overhead and the allocation of the sample indices
+        stop = (n - 1) * self._physical_system.tau
+        t = self._sample_indices[:n] * (stop / (n - 1) if n > 1 else 0.0)
+        t[-1] = stop
+        # Phase of each sample within its period (0 <= x < 1). Subtracting the floor is much faster than the float
+        # modulo t % (1 / frequency) and keeps the exact frequency.
+        x = np.multiply(t, self._frequency, out=t)
+        x -= np.floor(x)
+        # The step function only takes two values: high from the high low ratio to the end of each period, low before
+        x = np.where(x >= high_low_ratio, high, low)
+        # Rotate the step function by the phase shift with two slice assignments (equal to np.roll)
+        if k:
+            self._reference[:k] = x[-k:]
+            self._reference[k:] = x[:-k]
+        else:
+            self._reference[:] = x
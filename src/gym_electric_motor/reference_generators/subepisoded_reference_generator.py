@@ -41,10 +41,14 @@ class SubepisodedReferenceGenerator(ReferenceGenerator, RandomComponent):
         self._current_episode_length = int(self._get_current_value(episode_lengths))
         self._k = 0
         self._reference_names = [self._reference_state]
+        # Zero reference array and index of the referenced state. Built on the first get_reference call.
+        self._zero_reference = None
+        self._reference_idx = None
 
     def set_modules(self, physical_system):
         super().set_modules(physical_system)
         self._referenced_states = set_state_array({self._reference_state: 1}, physical_system.state_names).astype(bool)
+        self._zero_reference = None
         rs = self._referenced_states
         ps = physical_system
         if self._limit_margin is None:
@@ -86,8 +90,12 @@ class SubepisodedReferenceGenerator(ReferenceGenerator, RandomComponent):
         return super().reset(initial_state)
 
     def get_reference(self, *_, **__):
-        reference = np.zeros_like(self._referenced_states, dtype=float)
-        reference[self._referenced_states] = self._reference_value
+        if self._zero_reference is None:
+            self._zero_reference = np.zeros_like(self._referenced_states, dtype=float)
+            self._reference_idx = np.flatnonzero(self._referenced_states)[0]
+        # Copying the prepared array is much faster than allocating it and writing through the boolean mask
+        reference = self._zero_reference.copy()
+        reference[self._reference_idx] = self._reference_value
         return reference
 
     def get_reference_observation(self, *_, **__):
@@ -116,4 +124,4 @@ class SubepisodedReferenceGenerator(ReferenceGenerator, RandomComponent):
         if type(value_range) in [int, float]:
             return value_range
         elif type(value_range) in [list, tuple, np.ndarray]:
-            return (value_range[1] - value_range[0]) * self._random_generator.uniform() + value_range[0]
+            return (value_range[1] - value_range[0]) * self.random_generator.uniform() + value_range[0]
@@ -91,5 +91,5 @@ class SwitchedReferenceGenerator(ReferenceGenerator, RandomComponent):
         super().seed(seed)
         for sub_generator in self._sub_generators:
             if isinstance(sub_generator, RandomComponent):
-                seed = self._seed_sequence.spawn(1)[0]
+                seed = self.seed_sequence.spawn(1)[0]
                 sub_generator.seed(seed)
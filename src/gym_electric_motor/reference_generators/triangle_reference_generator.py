@@ -61,11 +61,11 @@ class TriangularReferenceGenerator(SubepisodedReferenceGenerator):
             self._current_episode_length,
         )
         phase = (
-            self._random_generator.uniform() * 2 * np.pi
+            self.random_generator.uniform() * 2 * np.pi
         )  # note: in the scipy implementation of sawtooth() 1 time-period
         # corresponds to a phase of 2pi
         ref_width = (
-            self._random_generator.uniform()
+            self.random_generator.uniform()
         )  # a random value between 0,1 that creates asymmetry in the triangular reference
         # wave ref_width=1 creates a sawtooth waveform
         self._reference = (
@@ -1,8 +1,24 @@
 import numpy as np
 
+from ..utils import njit
 from .subepisoded_reference_generator import SubepisodedReferenceGenerator
 
 
+@njit(cache=True)
+def _clipped_random_walk(reference_value, increments, lower, upper, reference):
+    """Sums up the increments starting from the reference value and clips the sum to [lower, upper] after each step.
+
+    The results are written into the reference array.
+    """
+    for i in range(increments.shape[0]):
+        reference_value += increments[i]
+        if reference_value > upper:
+            reference_value = upper
+        if reference_value < lower:
+            reference_value = lower
+        reference[i] = reference_value
+
+
 class WienerProcessReferenceGenerator(SubepisodedReferenceGenerator):
     """Reference Generator that generates a reference for one state by a Wiener Process with the changing parameter
     sigma and mean = 0.
@@ -29,16 +45,27 @@ class WienerProcessReferenceGenerator(SubepisodedReferenceGenerator):
 
     def _reset_reference(self):
         self._current_sigma = 10 ** self._get_current_value(np.log10(self._sigma_range))
-        random_values = self._random_generator.normal(0, self._current_sigma, self._current_episode_length)
+        random_values = self._random_increments(self._current_sigma, self._current_episode_length)
         self._reference = np.zeros_like(random_values)
-        reference_value = self._reference_value
-        for i in range(self._current_episode_length):
-            reference_value += random_values[i]
-            if reference_value > self._limit_margin[1]:
-                reference_value = self._limit_margin[1]
-            if reference_value < self._limit_margin[0]:
-                reference_value = self._limit_margin[0]
-            self._reference[i] = reference_value
+        _clipped_random_walk(
+            float(self._reference_value),
+            random_values,
+            float(self._limit_margin[0]),
+            float(self._limit_margin[1]),
+            self._reference,
+        )
+
+    def _random_increments(self, sigma, size):
+        """Draws the normally distributed increments of the Wiener Process for the next sub episode.
+
+        Args:
+            sigma(float): Standard deviation of the increments.
+            size(int): Number of increments to draw.
+
+        Returns:
+            ndarray(float): The increments.
+        """
+        return self.random_generator.normal(0, sigma, size)
 
     def reset(self, initial_state=None, initial_reference=None):
         if initial_reference is None:
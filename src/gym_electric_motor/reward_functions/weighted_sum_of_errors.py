@@ -84,6 +84,8 @@ class WeightedSumOfErrors(RewardFunction):
         self._gamma = gamma
         self._bias = bias
         self._violation_reward = violation_reward
+        self._scaled_weights = None
+        self._linear = False
 
     def set_modules(self, physical_system, reference_generator, constraint_monitor):
         super().set_modules(physical_system, reference_generator, constraint_monitor)
@@ -121,9 +123,14 @@ class WeightedSumOfErrors(RewardFunction):
             self.reward_range = (-rw_sum + self._bias, self._bias)
         if self._violation_reward is None:
             self._violation_reward = min(self.reward_range[0] / (1.0 - self._gamma), 0)
+        # With reward powers of one, the weighted sum reduces to a sum over the prescaled weights
+        self._linear = bool(np.all(self._n == 1))
+        self._scaled_weights = self._reward_weights / self._state_length
 
     def reward(self, state, reference, k=None, action=None, violation_degree=0.0):
         return (1.0 - violation_degree) * self._wse_reward(state, reference) + violation_degree * self._violation_reward
 
     def _wse_reward(self, state, reference):
+        if self._linear:
+            return self._bias - (self._scaled_weights * np.abs(state - reference)).sum()
         return -np.sum(self._reward_weights * (abs(state - reference) / self._state_length) ** self._n) + self._bias
@@ -1,19 +1,83 @@
 import gymnasium
 import numpy as np
 
+try:
+    import numba
+except ImportError:  # numba is an optional dependency
+    numba = None
+
+#: Flag, if numba is installed and the compiled (jitted) code paths can be used.
+NUMBA_AVAILABLE = numba is not None
+
+
+def njit(*args, **kwargs):
+    """Compiles a function in nopython mode with numba, if numba is installed.
+
+    Without numba, the function is returned unchanged. Can be used as plain decorator ``@njit`` or with the arguments
+    of ``numba.njit`` like ``@njit(cache=True)``.
+    """
+    if NUMBA_AVAILABLE:
+        return numba.njit(*args, **kwargs)
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
+
+
+def _initialize_default(base_class, arg, default_class, default_args):
+    return default_class(**default_args)
+
+
+def _initialize_updated_default(base_class, arg, default_class, default_args):
+    default_args.update(arg)
+    return default_class(**default_args)
+
+
+def _class_name(cls):
+    """Readable name of a class, a tuple of classes or a functools.partial of a class for error messages."""
+    if isinstance(cls, tuple):
+        return "/".join(_class_name(member) for member in cls)
+    func = getattr(cls, "func", None)
+    if func is not None:
+        return _class_name(func)
+    return getattr(cls, "__name__", repr(cls))
+
+
+def _initialize_from_string(base_class, arg, default_class, default_args):
+    raise Exception(
+        f"Selecting the {_class_name(base_class)} by the string '{arg}' is deprecated since version 3.0.0. "
+        f"Pass an instance or a dict of parameters for the default {_class_name(default_class)} instead."
+    )
+
+
+#: Handlers of the initialize function for the exact type of the passed argument.
+_INITIALIZE_HANDLERS = {
+    type(None): _initialize_default,
+    dict: _initialize_updated_default,
+    str: _initialize_from_string,
+}
+
 
 def initialize(base_class, arg, default_class, default_args):
-    if arg is None:
-        return default_class(**default_args)
+    """Initializes a component of an environment from the passed env-arg.
+
+    Args:
+        base_class(type / tuple(type)): Accepted type of already instantiated components. A single class or a flat
+            tuple of classes that is passed to ``isinstance`` as it is (e.g. ``(ElectricMotorVisualization, list)``).
+        arg(None / dict / instance): The env-arg passed by the user. None selects the default class with the default
+            arguments and a dict updates the default arguments. Instances of the base_class are returned unchanged.
+        default_class(type): Class of the component, if no instance is passed.
+        default_args(dict): Default arguments for the default class.
+
+    Returns:
+        The initialized component.
+    """
+    handler = _INITIALIZE_HANDLERS.get(type(arg))
+    if handler is not None:
+        return handler(base_class, arg, default_class, default_args)
     if isinstance(arg, type):
         raise Exception("Need initialization value")
     elif isinstance(arg, base_class):
         return arg
-    elif type(arg) is str:
-        raise Exception("Deprecated in version 3.0.0")
-    elif type(arg) is dict:
-        default_args.update(arg)
-        return default_class(**default_args)
 
 
 def state_dict_to_state_array(state_dict, state_array, state_names):
@@ -5,6 +5,7 @@ from enum import Enum
 import gymnasium
 import matplotlib
 import matplotlib.pyplot as plt
+import numpy as np
 
 from gym_electric_motor.core import ElectricMotorVisualization
 
@@ -49,6 +50,7 @@ class MotorDashboardLegacy(ElectricMotorVisualization):
         time_plot_width=10000,
         style=None,
         scale_plots=None,
+        dtype=np.float64,
     ):
         """
         Args:
@@ -66,6 +68,8 @@ class MotorDashboardLegacy(ElectricMotorVisualization):
                 (1 second for continuously controlled environments / 0.1 second for discretely controlled environments)
             style(string): Select one of the matplotlib-styles. e.g. "dark-background".
                 Default: None (the already selected style)
+            dtype(np.dtype): Floating point type of the preallocated data buffers of the time plots. Single precision
+                is sufficient for plotting and halves the memory of the buffers. Default: np.float64
         """
         # Basic assertions
         assert isinstance(reward_plot, bool)
@@ -75,6 +79,7 @@ class MotorDashboardLegacy(ElectricMotorVisualization):
         assert type(time_plot_width) in [int, float]
         assert time_plot_width > 0
         assert style in plt.style.available or style is None
+        assert np.issubdtype(dtype, np.floating)
 
         super().__init__()
 
@@ -101,6 +106,7 @@ class MotorDashboardLegacy(ElectricMotorVisualization):
         self._time_plots = []
         self._update_interval = int(update_interval)
         self._time_plot_width = int(time_plot_width)
+        self._dtype = np.dtype(dtype)
         self._plots = []
         self._k = 0
         self._update_render = False
@@ -206,6 +212,7 @@ class MotorDashboardLegacy(ElectricMotorVisualization):
 
         for time_plot in self._time_plots:
             time_plot.set_width(self._time_plot_width)
+            time_plot.set_dtype(self._dtype)
 
         for plot in self._plots:
             plot.set_env(env)
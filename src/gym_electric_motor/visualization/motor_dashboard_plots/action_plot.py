@@ -44,7 +44,7 @@ class ActionPlot(TimePlot):
 
     def reset_data(self):
         super().reset_data()
-        self._action_data = np.full(shape=self._x_data.shape, fill_value=np.nan)
+        self._action_data = np.full(shape=self._x_data.shape, fill_value=np.nan, dtype=self._dtype)
         self._y_data.append(self._action_data)
 
     def set_env(self, env):
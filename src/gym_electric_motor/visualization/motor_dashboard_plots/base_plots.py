@@ -101,6 +101,9 @@ class TimePlot(MotorDashboardPlot):
         _t(float): The cumulative simulation time.
         _k(int): The cumulative no of taken steps.
         _x_width(int): The width of the x-axis plot. (Set automatically by the dashboard)
+        _dtype(np.dtype): The floating point type of the y-data arrays. (Set automatically by the dashboard)
+        _event_lines(list(matplotlib.lines.Line2D)): The drawn reset and violation lines. Lines that left the plotted
+            time window are removed on rendering.
 
     """
 
@@ -126,9 +129,11 @@ class TimePlot(MotorDashboardPlot):
         self._tau = None
         self._done = None
         self._x_width = 10000
+        self._dtype = np.float64
         self._k = 0
         self._reset_memory = []
         self._violation_memory = []
+        self._event_lines = []
 
     def set_width(self, width):
         """Sets the width of the plot in data points.
@@ -138,6 +143,16 @@ class TimePlot(MotorDashboardPlot):
         """
         self._x_width = width
 
+    def set_dtype(self, dtype):
+        """Sets the floating point type of the y-data arrays.
+
+        The time data is always stored in double precision to keep the time axis exact in long runs.
+
+        Args:
+            dtype(np.dtype): The floating point type of the plotted data
+        """
+        self._dtype = np.dtype(dtype)
+
     def set_env(self, env):
         super().set_env(env)
         self._tau = env.physical_system.tau
@@ -150,6 +165,7 @@ class TimePlot(MotorDashboardPlot):
         self._t = 0
         self._reset_memory = []
         self._violation_memory = []
+        self._event_lines = []
         self._x_data = np.linspace(0, self._x_width * self._tau, self._x_width, endpoint=False)
         self._x_lim = (0, self._x_data[-1])
 
@@ -171,13 +187,23 @@ class TimePlot(MotorDashboardPlot):
         super().render()
 
         for violation in self._violation_memory:
-            self._axis.axvline(violation, **self._violation_line_cfg)
+            self._event_lines.append(self._axis.axvline(violation, **self._violation_line_cfg))
         self._violation_memory = []
 
         for reset in self._reset_memory:
-            self._axis.axvline(reset, **self._reset_line_cfg)
+            self._event_lines.append(self._axis.axvline(reset, **self._reset_line_cfg))
         self._reset_memory = []
 
+        # Lines outside of the time window are invisible but would still be drawn on every update
+        lower_lim = self._axis.get_xlim()[0]
+        visible_lines = []
+        for line in self._event_lines:
+            if line.get_xdata()[0] < lower_lim:
+                line.remove()
+            else:
+                visible_lines.append(line)
+        self._event_lines = visible_lines
+
     def _scale_x_axis(self):
         """The x-axis is modeled as a sliding window in this plot."""
         x_lim = self._axis.get_xlim()
@@ -103,8 +103,8 @@ class StatePlot(TimePlot):
     def reset_data(self):
         super().reset_data()
         # Initialize the data containers
-        self._state_data = np.full(shape=self._x_data.shape, fill_value=np.nan)
-        self._ref_data = np.full(shape=self._x_data.shape, fill_value=np.nan)
+        self._state_data = np.full(shape=self._x_data.shape, fill_value=np.nan, dtype=self._dtype)
+        self._ref_data = np.full(shape=self._x_data.shape, fill_value=np.nan, dtype=self._dtype)
 
     def initialize(self, axis):
         # Docstring of superclass
@@ -55,3 +55,15 @@ def test_execution(dc_motor, control_task, action_type, version, no_of_steps):
         # This happens if limits are violated or if some states are not observed to lay within their limits.
         assert observation[0].shape == env.observation_space[0].shape, "The shape of the state is incorrect."
         assert observation[1].shape == env.observation_space[1].shape, "The shape of the reference is incorrect."
+
+
+@pytest.mark.parametrize("vectorization_mode", ["sync", "async"])
+def test_vector_execution(vectorization_mode):
+    envs = gem.make_vec("Finite-CC-SeriesDc-v0", num_envs=2, vectorization_mode=vectorization_mode, visualization=None)
+    (states, references), _ = envs.reset(seed=0)
+    assert states.shape == (2, 5) and references.shape == (2, 1)
+    for _ in range(5):
+        (states, references), rewards, terminated, truncated, _ = envs.step(envs.action_space.sample())
+        assert states.shape == (2, 5) and rewards.shape == (2,) and terminated.shape == (2,)
+        assert not np.any(np.isnan(states))
+    envs.close()
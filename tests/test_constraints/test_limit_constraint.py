@@ -58,6 +58,19 @@ class TestLimitConstraint:
                 np.array([-1.1, 1.1, 0.0]),
                 1.0,
             ],
+            [
+                DummyPhysicalSystem(3),
+                ["dummy_state_1", "dummy_state_2"],
+                np.array([-1.1, 0.5, 1.1]),
+                1.0,
+            ],
+            [
+                DummyPhysicalSystem(3),
+                ["dummy_state_1", "dummy_state_2"],
+                np.array([-1.1, 0.5, -0.1]),
+                0.0,
+            ],
+            [DummyPhysicalSystem(2), [], np.array([-1.1, 1.1]), 0.0],
         ],
     )
     def test_call(self, ps, observed_state_names, state, expected_violation):
@@ -65,3 +78,19 @@ class TestLimitConstraint:
         lc.set_modules(ps)
         violation = lc(state)
         assert violation == expected_violation
+
+    @pytest.mark.parametrize(
+        ["observed_state_names", "expected_view"],
+        [
+            [["dummy_state_1", "dummy_state_2"], slice(1, 3)],
+            [["all_states"], slice(0, 4)],
+            [["dummy_state_0", "dummy_state_2"], np.array([0, 2])],
+        ],
+    )
+    def test_observed_view(self, observed_state_names, expected_view):
+        lc = LimitConstraint(observed_state_names)
+        lc.set_modules(DummyPhysicalSystem(4))
+        if isinstance(expected_view, slice):
+            assert lc._observed_view == expected_view
+        else:
+            assert np.all(lc._observed_view == expected_view)
@@ -98,3 +98,21 @@ class TestSquaredConstraint:
         sc.set_modules(ps)
         violation = sc(state)
         assert violation == expected_violation
+
+    @pytest.mark.parametrize(
+        ["observed_state_names", "expected_index"],
+        [
+            [["dummy_state_1", "dummy_state_2"], slice(1, 3)],
+            [["dummy_state_2", "dummy_state_1"], slice(1, 3)],
+            [["dummy_state_3", "dummy_state_0"], [0, 3]],
+        ],
+    )
+    def test_state_indices(self, observed_state_names, expected_index):
+        sc = SquaredConstraint(observed_state_names)
+        sc.set_modules(DummyPhysicalSystem(4))
+        if isinstance(expected_index, slice):
+            assert sc._state_indices == expected_index
+        else:
+            assert np.all(sc._state_indices == expected_index)
+        state = np.array([0.1, 0.6, 0.7, 0.9])
+        assert sc(state) == float(sum(state[int(name[-1])] ** 2 for name in observed_state_names) > 1.0)
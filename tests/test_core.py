@@ -200,6 +200,38 @@ class TestElectricMotorEnvironment:
             with pytest.raises(Exception):
                 env.step(action)
 
+    def test_state_filter(self):
+        env = self.test_class(
+            physical_system=DummyPhysicalSystem(3),
+            reference_generator=DummyReferenceGenerator(),
+            reward_function=DummyRewardFunction(),
+            constraints=DummyConstraintMonitor(0),
+            state_filter=["dummy_state_2", "dummy_state_0"],
+        )
+        assert env._state_filter_idx.dtype == np.intp
+        env.reset()
+        (state, _), *_ = env.step(1)
+        assert np.all(state == np.array([3, 1]))
+
+    @pytest.mark.parametrize("state_filter", [None, ["dummy_state_2", "dummy_state_0"]])
+    def test_observation_dtype(self, state_filter):
+        env = self.test_class(
+            physical_system=DummyPhysicalSystem(3),
+            reference_generator=DummyReferenceGenerator(),
+            reward_function=DummyRewardFunction(),
+            constraints=DummyConstraintMonitor(0),
+            state_filter=state_filter,
+            observation_dtype=np.float32,
+        )
+        assert env._full_state_observation == (state_filter is None)
+        assert all(space.dtype == np.float32 for space in env.observation_space)
+        observations = [env.reset()[0], env.step(0)[0]]
+        for state, reference in observations:
+            assert state.dtype == np.float32 and reference.dtype == np.float32
+            assert (state, reference) in env.observation_space
+        assert np.all(observations[1][0] == env.current_state[env.state_filter])
+        assert not np.shares_memory(observations[1][0], env.current_state)
+
     def test_close(self, env):
         ps = env.physical_system
         rg = env.reference_generator
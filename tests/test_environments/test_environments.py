@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 
@@ -34,3 +35,73 @@ def test_referenced_states_ac(
     env_id = f"{action_type}-{control_task}-{ac_motor}-{version}"
     env = gem.make(env_id)
     assert env.unwrapped.reference_generator.reference_names == referenced_states
+
+
+@pytest.mark.parametrize("action_type", action_types)
+def test_current_control_extex_dc_components(action_type):
+    env_id = f"{action_type}-CC-ExtExDc-v0"
+    env = gem.make(env_id)
+    assert env.unwrapped.reference_generator.reference_names == ["i_a", "i_e"]
+    assert env.action_space.shape == (2,)
+
+    reference_generator = gem.reference_generators.MultipleReferenceGenerator(
+        sub_generators=(
+            gem.reference_generators.ConstReferenceGenerator("i_a", 0.1),
+            gem.reference_generators.ConstReferenceGenerator("i_e", 0.2),
+        )
+    )
+    env = gem.make(env_id, reference_generator=reference_generator)
+    assert env.unwrapped.reference_generator is reference_generator
+
+
+@pytest.mark.parametrize("control_task", ["TC", "SC"])
+@pytest.mark.parametrize("action_type", action_types)
+def test_extex_dc_observation_dtype(action_type, control_task):
+    env_id = f"{action_type}-{control_task}-ExtExDc-v0"
+    env = gem.make(env_id)
+    (state, reference), _ = env.reset(seed=0)
+    assert state.dtype == np.float64 and reference.dtype == np.float64
+    assert all(space.dtype == np.float64 for space in env.observation_space)
+    env = gem.make(env_id, observation_dtype=np.float32)
+    (state, reference), _ = env.reset(seed=0)
+    assert state.dtype == np.float32 and reference.dtype == np.float32
+    assert all(space.dtype == np.float32 for space in env.observation_space)
+
+
+@pytest.mark.parametrize("control_task", control_tasks)
+@pytest.mark.parametrize("action_type", action_types)
+def test_scim_observation_dtype(action_type, control_task):
+    env_id = f"{action_type}-{control_task}-SCIM-v0"
+    env = gem.make(env_id)
+    (state, reference), _ = env.reset(seed=0)
+    assert state.dtype == np.float64 and reference.dtype == np.float64
+    assert all(space.dtype == np.float64 for space in env.observation_space)
+    env = gem.make(env_id, observation_dtype=np.float32)
+    (state, reference), _ = env.reset(seed=0)
+    assert state.dtype == np.float32 and reference.dtype == np.float32
+    assert all(space.dtype == np.float32 for space in env.observation_space)
+
+
+def test_torque_control_extex_dc_ode_solver():
+    env = gem.make("Cont-TC-ExtExDc-v0")
+    assert isinstance(env.unwrapped.physical_system._ode_solver, gem.physical_systems.ZOHDiscreteSolver)
+
+    # A load with a speed dependent torque makes the system nonlinear, where the ZOH discretization is not exact
+    envs = [
+        gem.make(
+            "Cont-TC-ExtExDc-v0",
+            load=gem.physical_systems.PolynomialStaticLoad(
+                load_parameter=dict(a=0.01, b=0.05, c=0.01, j_load=1e-4)
+            ),
+            **kwargs,
+        )
+        for kwargs in (dict(), dict(ode_solver=gem.physical_systems.ScipyOdeSolver("dop853", rtol=1e-10, atol=1e-12)))
+    ]
+    assert isinstance(envs[0].unwrapped.physical_system._ode_solver, gem.physical_systems.ScipyOdeSolver)
+    for env in envs:
+        env.reset(seed=0)
+    rng = np.random.default_rng(0)
+    for _ in range(1000):
+        action = np.array([0.02 * (1.0 + rng.uniform(-1.0, 1.0)), 0.5])
+        states = [env.step(action)[0][0] for env in envs]
+        assert np.allclose(states[0], states[1], atol=1e-4)
@@ -1,7 +1,11 @@
+import copy
+
+import numpy as np
 import pytest
 
 import gym_electric_motor as gem
 import tests.testing_utils as tu
+from gym_electric_motor.physical_system_wrappers.physical_system_wrapper import state_indexer
 
 
 class TestPhysicalSystemWrapper:
@@ -47,8 +51,90 @@ class TestPhysicalSystemWrapper:
     def test_reset(self, processor, physical_system):
         assert all(processor.reset() == physical_system.state)
 
+    def test_reset_rejects_keywords(self, processor):
+        with pytest.raises(TypeError):
+            processor.reset(initial_state=None)
+
     @pytest.mark.parametrize(["action"], [[1]])
     def test_simulate(self, reset_processor, physical_system, action):
         state = reset_processor.simulate(action)
         assert state == physical_system.state
         assert action == physical_system.action
+
+
+@pytest.mark.parametrize(
+    ["state_names", "expected"],
+    [
+        [["b", "c", "d"], slice(1, 4)],
+        [["a"], slice(0, 1)],
+        [["d", "b"], [3, 1]],
+        [["a", "c"], [0, 2]],
+        [[], []],
+    ],
+)
+def test_state_indexer(state_names, expected):
+    state_positions = dict(a=0, b=1, c=2, d=3)
+    state = np.array([10.0, 11.0, 12.0, 13.0])
+    index = state_indexer(state_positions, state_names)
+    if isinstance(expected, slice):
+        assert index == expected
+    else:
+        assert np.all(index == np.array(expected, dtype=np.intp))
+    assert np.all(state[index] == np.array([state[state_positions[name]] for name in state_names]))
+
+
+def test_attribute_forwarding():
+    physical_system = tu.DummyPhysicalSystem()
+    physical_system.custom_attribute = 5
+    processor = gem.physical_system_wrappers.PhysicalSystemWrapper(physical_system=physical_system)
+    assert processor.custom_attribute == 5
+    with pytest.raises(AttributeError):
+        processor._custom_attribute
+    with pytest.raises(AttributeError):
+        processor.missing_attribute
+
+
+def test_deepcopy():
+    processor = gem.physical_system_wrappers.CurrentSumProcessor(
+        ("dummy_state_0", "dummy_state_1"), physical_system=tu.DummyPhysicalSystem(state_length=2)
+    )
+    copied = copy.deepcopy(processor)
+    assert copied.state_names == processor.state_names
+    assert copied.physical_system is not processor.physical_system
+    assert all(copied.reset() == processor.reset())
+
+
+def test_reset_random_generator():
+    processor = gem.physical_system_wrappers.PhysicalSystemWrapper(physical_system=tu.DummyPhysicalSystem())
+    gem.RandomComponent.seed(processor, np.random.SeedSequence(123))
+    # Every episode spawns its own generator, even if the previous episodes did not draw any random numbers
+    processor.reset()
+    processor.reset()
+    expected = np.random.default_rng(np.random.SeedSequence(123).spawn(3)[2]).random()
+    assert processor.random_generator.random() == expected
+
+
+def test_simulate_binding():
+    physical_system = tu.DummyPhysicalSystem()
+    processor = gem.physical_system_wrappers.PhysicalSystemWrapper(physical_system=physical_system)
+    assert processor.simulate == physical_system.simulate
+    noise_processor = gem.physical_system_wrappers.StateNoiseProcessor(
+        states=["dummy_state_0"], physical_system=physical_system
+    )
+    assert "simulate" not in vars(noise_processor)
+    copied = copy.deepcopy(processor)
+    assert copied.simulate == copied.physical_system.simulate
+
+
+def test_str():
+    physical_system = tu.DummyPhysicalSystem()
+    processor = gem.physical_system_wrappers.PhysicalSystemWrapper(physical_system=physical_system)
+    double_wrapped = gem.physical_system_wrappers.PhysicalSystemWrapper(physical_system=processor)
+    assert str(double_wrapped) == f"<PhysicalSystemWrapper<PhysicalSystemWrapper{physical_system}>>"
+    assert repr(double_wrapped) == str(double_wrapped)
+    # Replacing the system of an inner wrapper changes the string of the outer wrapper
+    other_system = tu.DummyPhysicalSystem()
+    processor.set_physical_system(other_system)
+    assert str(double_wrapped) == f"<PhysicalSystemWrapper<PhysicalSystemWrapper{other_system}>>"
+    double_wrapped.set_physical_system(other_system)
+    assert str(double_wrapped) == f"<PhysicalSystemWrapper{other_system}>"
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+import gym_electric_motor as gem
+
+from .test_physical_system_wrapper import TestPhysicalSystemWrapper
+
+
+class TestStateNoiseProcessor(TestPhysicalSystemWrapper):
+    @pytest.fixture
+    def processor(self, physical_system):
+        return gem.physical_system_wrappers.StateNoiseProcessor(
+            states=["dummy_state_0"], physical_system=physical_system
+        )
+
+    def test_noise_is_added(self, reset_processor, physical_system):
+        assert not reset_processor.is_identity
+        noise = reset_processor._noise[reset_processor._random_pointer]
+        state = reset_processor.simulate(np.array([1.0]))
+        assert np.allclose(state, 1.0 + noise)
+
+    @pytest.mark.parametrize(
+        ["states", "random_dist", "random_kwargs", "identity"],
+        [
+            [[], "normal", dict(), True],
+            [["dummy_state_0"], "normal", dict(scale=0.0), True],
+            [["dummy_state_0"], "laplace", dict(loc=0.0, scale=0.0), True],
+            [["dummy_state_0"], "normal", dict(loc=1.0, scale=0.0), False],
+            [["dummy_state_0"], "normal", dict(scale=0.1), False],
+            [["dummy_state_0"], "uniform", dict(low=0.0, high=0.0), False],
+        ],
+    )
+    def test_identity(self, physical_system, states, random_dist, random_kwargs, identity):
+        processor = gem.physical_system_wrappers.StateNoiseProcessor(
+            states=states,
+            random_dist=random_dist,
+            random_kwargs=random_kwargs,
+            physical_system=physical_system,
+        )
+        assert processor.is_identity == identity
+        processor.reset()
+        state = processor.simulate(np.array([0.5]))
+        if identity:
+            assert processor._noise is None
+            assert np.all(state == np.array([0.5]))
+        else:
+            assert processor._noise is not None
+
+    def test_random_kwargs_setter(self, processor):
+        processor.random_kwargs = dict(scale=0.0)
+        assert processor.is_identity
+        processor.random_kwargs = dict(scale=1.0)
+        assert not processor.is_identity
@@ -796,6 +796,14 @@ def test_continuous_b6_bridge():
 # region second version tests
 
 
+@pytest.mark.parametrize("action", [-1, 0, 2, 3, 4, np.int64(1), np.int8(4), np.array(1), 1.0, True])
+def test_finite_converter_valid_action(monkeypatch, action):
+    converter = cv.FiniteConverter()
+    action_space = Discrete(3, start=1)
+    monkeypatch.setattr(converter, "action_space", action_space)
+    assert converter._is_valid_action(action) == action_space.contains(action)
+
+
 class TestPowerElectronicConverter:
     class_to_test = cv.PowerElectronicConverter
     key = ""
@@ -1004,14 +1012,31 @@ class TestFiniteFourQuadrantConverter(TestFiniteConverter):
         ]
         return converter
 
-    def test_set_action(self, converter, *_):
+    @pytest.fixture
+    def interlocking_converter(self):
+        converter = self.class_to_test(interlocking_time=1e-6)
+        tau = converter._tau
+        converter._subconverters = [
+            PowerElectronicConverterWrapper(converter._subconverters[0], tau=tau),
+            PowerElectronicConverterWrapper(converter._subconverters[1], tau=tau),
+        ]
+        return converter
+
+    def test_set_action(self, converter, interlocking_converter, *_):
+        for action in range(interlocking_converter.action_space.n):
+            t = np.random.rand()
+            interlocking_converter.set_action(action, t)
+            assert interlocking_converter._subconverters[0].last_t == t
+            assert interlocking_converter._subconverters[1].last_t == t
+            assert interlocking_converter._subconverters[0].last_action == action // 2 + 1
+            assert interlocking_converter._subconverters[1].last_action == action % 2 + 1
+
+        # Without interlocking time, the lookup table replaces the subconverters
         for action in range(converter.action_space.n):
             t = np.random.rand()
-            converter.set_action(action, t)
-            assert converter._subconverters[0].last_t == t
-            assert converter._subconverters[1].last_t == t
-            assert converter._subconverters[0].last_action == action // 2 + 1
-            assert converter._subconverters[1].last_action == action % 2 + 1
+            assert converter.set_action(action, t) == [t + converter.tau]
+            assert converter._subconverters[0].last_t is None
+            assert converter._subconverters[1].last_t is None
 
         converter = self.class_to_test()
         time = 0
@@ -1028,7 +1053,8 @@ class TestFiniteFourQuadrantConverter(TestFiniteConverter):
         assert str(np.pi) in str(assertText.value) and "Discrete(4)" in str(assertText.value)
 
     @pytest.mark.parametrize("i_out", [[-12], [0], [12]])
-    def test_convert(self, converter, i_out):
+    def test_convert(self, interlocking_converter, i_out):
+        converter = interlocking_converter
         t = np.random.rand()
         converter.set_action(converter.action_space.sample(), t)
         u = converter.convert(i_out, t)
@@ -1044,7 +1070,8 @@ class TestFiniteFourQuadrantConverter(TestFiniteConverter):
         assert np.all([conv.reset_calls == reset_calls[0] + 1 for conv in converter._subconverters])
 
     @pytest.mark.parametrize("i_out", [[-1], [0], [1]])
-    def test_i_sup(self, converter, i_out):
+    def test_i_sup(self, interlocking_converter, i_out):
+        converter = interlocking_converter
         for action in range(converter.action_space.n):
             converter.set_action(action, 0)
             converter.convert(i_out, 0)
@@ -1053,6 +1080,21 @@ class TestFiniteFourQuadrantConverter(TestFiniteConverter):
             assert converter._subconverters[1].last_i_out == [-i_out[0]]
             assert i_sup == converter._subconverters[0].last_i_sup + converter._subconverters[1].last_i_sup
 
+    @pytest.mark.parametrize("i_out", [[-12], [0], [12]])
+    def test_lookup_table(self, i_out):
+        """Without interlocking time, convert and i_sup use the lookup table instead of the subconverters."""
+        converter = self.class_to_test()
+        for action in range(converter.action_space.n):
+            t = np.random.rand()
+            converter.set_action(action, t)
+            u = converter.convert(i_out, t)
+            i_sup = converter.i_sup(i_out)
+            subconverters = converter._subconverters
+            subconverters[0].set_action(action // 2 + 1, t)
+            subconverters[1].set_action(action % 2 + 1, t)
+            assert u == [subconverters[0].convert(i_out, t)[0] - subconverters[1].convert([-i_out[0]], t)[0]]
+            assert i_sup == subconverters[0].i_sup(i_out) + subconverters[1].i_sup([-i_out[0]])
+
 
 class TestContOneQuadrantConverter(TestContDynamicallyAveragedConverter):
     key = "Cont-1QC"
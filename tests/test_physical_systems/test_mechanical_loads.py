@@ -229,6 +229,14 @@ class TestConstSpeedLoad(TestMechanicalLoad):
         load = ConstantSpeedLoad(omega_fixed=60)
         assert load.omega_fixed == 60
 
+    def test_independent_initializers(self):
+        load = ConstantSpeedLoad(omega_fixed=60)
+        default_load = ConstantSpeedLoad()
+        assert default_load.omega_fixed == 0.0
+        assert default_load.initializer["states"] == {"omega": 0.0}
+        assert load.initializer["states"] is not default_load.initializer["states"]
+        assert ConstantSpeedLoad._default_initializer["states"] == {"omega": 0.0}
+
     def test_mechanical_ode(self, const_speed_load):
         assert all(const_speed_load.mechanical_ode() == 0)
 
@@ -121,6 +121,14 @@ class TestSCMLSystem:
             scml_system.mechanical_load.mechanical_state == state[:2]
         ), "The mech. state was not returned correctly"
 
+    def test_state_indices(self, scml_system):
+        """Test, if the slices used in simulate cover the same states as the index lists"""
+        positions = np.arange(len(scml_system.state_names))
+        assert np.all(positions[scml_system._currents_slice] == scml_system.CURRENTS_IDX)
+        assert np.all(positions[scml_system._voltages_slice] == scml_system.VOLTAGES_IDX)
+        assert np.all(positions[scml_system._u_sup_slice] == scml_system.U_SUP_IDX)
+        assert np.all(positions[scml_system._load_ode_slice] == scml_system._load_ode_idx)
+
     def test_simulate(self, scml_system):
         """Test the simulation function of the SCMLSystem"""
 
@@ -183,3 +191,28 @@ class TestSCMLSystem:
         assert np.all(sys_jac[:-2, 2:] == np.array([[72, 84], [78, 91]])), (
             "The derivative of the mech.state " "over the currents is false"
         )
+
+
+@pytest.mark.parametrize(
+    "load",
+    [
+        ml.PolynomialStaticLoad(load_parameter=dict(a=0.01, b=0.02, c=0.001, j_load=1e-4)),
+        ml.ConstantSpeedLoad(omega_fixed=100.0),
+    ],
+)
+@pytest.mark.parametrize("omega", [-50.0, 0.0, 1e-6, 80.0])
+def test_compiled_system_equation(load, omega):
+    """Tests that the compiled system equation of the DcMotorSystem equals the python system equation"""
+    dc_system = ps.DcMotorSystem(
+        converter=cv.ContMultiConverter(subconverters=(cv.ContFourQuadrantConverter(), cv.ContFourQuadrantConverter())),
+        motor=em.DcExternallyExcitedMotor(),
+        load=load,
+        supply=vs.IdealVoltageSupply(60.0),
+        ode_solver=sv.EulerSolver(),
+    )
+    system_equation, args = dc_system._build_compiled_system_equation()
+    state = np.array([omega, 12.0, 3.0])
+    u_in = np.array([40.0, -20.0])
+    derivative = np.zeros(3)
+    system_equation(0.0, state, u_in, derivative, *args)
+    assert np.allclose(derivative, dc_system._system_equation(0.0, state, u_in))
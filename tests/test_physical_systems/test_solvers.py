@@ -25,6 +25,155 @@ def test_euler():
         integration_testing(solver)
 
 
+def test_numba_euler():
+    """
+    tests if the numba euler solver falls back to the basic euler solver without a compiled system equation
+    :return:
+    """
+    for nsteps in [1, 5]:
+        solver = NumbaEulerSolver(nsteps)
+        integration_testing(solver)
+
+
+@pytest.mark.parametrize("nsteps", [1, 3])
+def test_numba_euler_dc_motor_system(nsteps):
+    """
+    tests if the numba euler solver integrates the compiled system equation of a physical system like the euler solver
+    :return:
+    """
+    import gym_electric_motor.physical_systems as ps
+
+    systems = [
+        ps.DcMotorSystem(
+            converter=ps.ContMultiConverter(
+                subconverters=(ps.ContFourQuadrantConverter(), ps.ContFourQuadrantConverter())
+            ),
+            motor=ps.DcExternallyExcitedMotor(),
+            load=ps.PolynomialStaticLoad(load_parameter=dict(a=0.01, b=0.02, c=0.001, j_load=1e-4)),
+            supply=ps.IdealVoltageSupply(60.0),
+            ode_solver=solver,
+            tau=1e-5,
+        )
+        for solver in (EulerSolver(nsteps), NumbaEulerSolver(nsteps))
+    ]
+    states = [system.reset() for system in systems]
+    assert np.all(states[0] == states[1])
+    for action in np.linspace([-1.0, 1.0], [1.0, 0.5], 50):
+        states = [system.simulate(action) for system in systems]
+        assert np.allclose(states[0], states[1], rtol=1e-9, atol=1e-12)
+
+
+@pytest.mark.parametrize("motor_system", ["DcSeries", "SCIM"])
+def test_numba_euler_compiled_motors(motor_system):
+    """
+    tests if the compiled odes of further motors are integrated like their python odes
+    :return:
+    """
+    import gym_electric_motor.physical_systems as ps
+
+    def make_system(solver):
+        load = ps.PolynomialStaticLoad(load_parameter=dict(a=0.01, b=0.02, c=0.001, j_load=1e-4))
+        if motor_system == "DcSeries":
+            return ps.DcMotorSystem(
+                converter=ps.ContFourQuadrantConverter(),
+                motor=ps.DcSeriesMotor(),
+                load=load,
+                supply=ps.IdealVoltageSupply(60.0),
+                ode_solver=solver,
+                tau=1e-5,
+            )
+        return ps.SquirrelCageInductionMotorSystem(
+            converter=ps.ContB6BridgeConverter(),
+            motor=ps.SquirrelCageInductionMotor(),
+            load=load,
+            supply=ps.IdealVoltageSupply(560.0),
+            ode_solver=solver,
+            tau=1e-5,
+        )
+
+    systems = [make_system(solver) for solver in (EulerSolver(), NumbaEulerSolver())]
+    assert systems[1]._build_compiled_system_equation() is not None
+    states = [system.reset() for system in systems]
+    assert np.all(states[0] == states[1])
+    for action in np.linspace(np.ones(3), -np.ones(3), 50):
+        action = action[: systems[0].action_space.shape[0]]
+        states = [system.simulate(action) for system in systems]
+        assert np.allclose(states[0], states[1], rtol=1e-9, atol=1e-12)
+
+
+def test_numba_euler_switching_times():
+    """
+    tests if the numba euler solver integrates steps of the sampling time and the shorter steps until the switching
+    times of a converter with interlocking time like the euler solver
+    :return:
+    """
+    import gym_electric_motor.physical_systems as ps
+
+    systems = [
+        ps.DcMotorSystem(
+            converter=ps.FiniteMultiConverter(
+                subconverters=(ps.FiniteFourQuadrantConverter, ps.FiniteFourQuadrantConverter),
+                interlocking_time=2e-6,
+            ),
+            motor=ps.DcExternallyExcitedMotor(),
+            load=ps.PolynomialStaticLoad(load_parameter=dict(a=0.01, b=0.02, c=0.001, j_load=1e-4)),
+            supply=ps.IdealVoltageSupply(60.0),
+            ode_solver=solver,
+            tau=1e-5,
+        )
+        for solver in (EulerSolver(), NumbaEulerSolver())
+    ]
+    for system in systems:
+        system.reset()
+    for action in [(1, 1), (2, 1), (2, 3), (0, 0), (1, 2), (3, 1)] * 5:
+        states = [system.simulate(np.array(action)) for system in systems]
+        assert np.allclose(states[0], states[1], rtol=1e-9, atol=1e-12)
+
+
+def test_numba_euler_shared_kernels():
+    """
+    tests if environments with the same motor and load share one compiled system equation and euler kernels,
+    independent of their motor parameters
+    :return:
+    """
+    import gym_electric_motor as gem
+
+    solvers = [
+        gem.make(
+            env_id, motor=dict(motor_parameter=dict(r_a=r_a)), ode_solver=NumbaEulerSolver()
+        ).unwrapped.physical_system._ode_solver
+        for env_id, r_a in (("Finite-TC-ExtExDc-v0", 15.5), ("Finite-CC-ExtExDc-v0", 20.0))
+    ]
+    assert solvers[0]._compiled_system_equation is solvers[1]._compiled_system_equation
+    assert solvers[0]._compiled_integrate is solvers[1]._compiled_integrate
+    assert solvers[0]._compiled_fixed_step_integrate is solvers[1]._compiled_fixed_step_integrate
+    assert solvers[0]._compiled_args[0][0] != solvers[1]._compiled_args[0][0]
+
+
+@pytest.mark.parametrize("use_jacobian", [True, False])
+def test_zoh_discrete(use_jacobian):
+    """
+    tests if the zero-order-hold solver integrates a linear system with piecewise constant inputs exactly
+    :return:
+    """
+    integration_testing(ZOHDiscreteSolver())
+    a = np.array([[-2.0, 1.0], [0.0, -50.0]])
+    b = np.array([[1.0, 0.0], [0.0, 20.0]])
+    solver = ZOHDiscreteSolver()
+    solver.set_system_equation(lambda t, state, u: a @ state + b @ u, (lambda t, state, u: a) if use_jacobian else None)
+    solver.set_initial_value(np.array([1.0, -1.0]), 0.0)
+    expected = np.array([1.0, -1.0])
+    tau = 1e-2
+    for k, u in enumerate([[1.0, 0.0], [-1.0, 2.0], [0.5, 0.5]] * 5):
+        u = np.array(u)
+        solver.set_f_params(u)
+        state = solver.integrate((k + 1) * tau)
+        # Analytic solution with the constant steady state of the input
+        steady_state = -np.linalg.solve(a, b @ u)
+        expected = steady_state + pss.expm(a * tau) @ (expected - steady_state)
+        assert np.allclose(state, expected, rtol=1e-6 if not use_jacobian else 1e-12, atol=1e-12)
+
+
 @pytest.mark.parametrize("integrator", ["dopri5", "dop853"])
 # 'vode', 'zvode', 'lsoda', could be added, but does not work due to wrong integration times
 def test_scipyode(integrator):
@@ -20,6 +20,15 @@ class TestRandomComponent:
         assert isinstance(random_component.seed_sequence, np.random.SeedSequence)
         assert isinstance(random_component.random_generator, np.random.Generator)
 
+    def test_unseeded(self, random_component):
+        """Test, if an unseeded RandomComponent provides a SeedSequence and a random generator on first use."""
+        assert isinstance(random_component.random_generator, np.random.Generator)
+        assert isinstance(random_component.seed_sequence, np.random.SeedSequence)
+        generator = random_component.random_generator
+        assert random_component.random_generator is generator
+        random_component.next_generator()
+        assert random_component.random_generator is not generator
+
     def test_reseed(self, random_component):
         """Test if the seed of the RandomComponent differs after two random seedings."""
         random_component.seed()
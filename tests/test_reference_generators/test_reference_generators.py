@@ -6,11 +6,13 @@ from numpy.random import seed
 
 import gym_electric_motor as gem
 import gym_electric_motor.reference_generators.sawtooth_reference_generator as sawrg
+import gym_electric_motor.reference_generators.step_reference_generator as steprg
 import gym_electric_motor.reference_generators.subepisoded_reference_generator as srg
 import gym_electric_motor.reference_generators.switched_reference_generator as swrg
 import gym_electric_motor.reference_generators.wiener_process_reference_generator as wrg
 from gym_electric_motor.core import ReferenceGenerator
 from gym_electric_motor.reference_generators import (
+    BatchedWienerProcessReferenceGenerator,
     ConstReferenceGenerator,
     MultipleReferenceGenerator,
 )
@@ -414,6 +416,44 @@ class TestWienerProcessReferenceGenerator:
         assert self._monkey_get_current_value_counter == 1, "get_current_value() not called once"
 
 
+class TestBatchedWienerProcessReferenceGenerator:
+    """
+    class for testing the batched wiener process reference generator
+    """
+
+    @pytest.mark.parametrize("batch_size, episode_length", [(4, 3), (2, 5), (100, 10)])
+    def test_random_increments(self, batch_size, episode_length):
+        sigma = 0.1
+        test_object = BatchedWienerProcessReferenceGenerator(batch_size=batch_size)
+        test_object._random_generator = np.random.default_rng(42)
+        generator = np.random.default_rng(42)
+        expected = []
+        pool = np.zeros(0)
+        idx = 0
+        for _ in range(5):
+            if idx + episode_length > len(pool):
+                pool = generator.standard_normal(max(batch_size, episode_length))
+                idx = 0
+            expected.append(pool[idx : idx + episode_length] * sigma)
+            idx += episode_length
+        increments = [test_object._random_increments(sigma, episode_length) for _ in range(5)]
+        assert np.all(np.concatenate(increments) == np.concatenate(expected))
+
+    def test_reset_discards_pool(self):
+        ps = DummyPhysicalSystem(2)
+        test_object = BatchedWienerProcessReferenceGenerator(reference_state="dummy_state_0", batch_size=1000)
+        test_object.set_modules(ps)
+        test_object.seed(np.random.SeedSequence(3))
+        test_object.reset(initial_reference=np.array([0.0, 0.0]))
+        references = [test_object.get_reference_observation()[0] for _ in range(20)]
+        test_object.seed(np.random.SeedSequence(3))
+        test_object.reset(initial_reference=np.array([0.0, 0.0]))
+        # Only the first sub episode of the new episode has been drawn from a fresh pool
+        assert test_object._pool_idx == test_object._current_episode_length
+        assert references == [test_object.get_reference_observation()[0] for _ in range(20)]
+        assert np.all(np.abs(references) <= 0.1)
+
+
 class TestFurtherReferenceGenerator:
     """
     class for testing SawtoothReferenceGenerator, SinusoidalReferenceGenerator, StepReferenceGenerator,
@@ -625,6 +665,55 @@ class TestFurtherReferenceGenerator:
         # verify expected results
         assert sum(abs(expected_reference - test_object._reference)) < 1e-6, "unexpected reference"
 
+    @pytest.mark.parametrize("seed", [0, 1, 2, 3])
+    @pytest.mark.parametrize("episode_length", [1, 7, 1000])
+    @pytest.mark.parametrize("compiled", [True, False])
+    @pytest.mark.parametrize("dtype", [np.float64, np.float32])
+    def test_step_reference(self, monkeypatch, seed, episode_length, compiled, dtype):
+        tau = 1e-4
+        physical_system = DummyPhysicalSystem(state_length=2)
+        physical_system._tau = tau
+        test_object = StepReferenceGenerator(
+            amplitude_range=(0.1, 0.8),
+            frequency_range=(1, 2000),
+            offset_range=(-0.5, 0.5),
+            limit_margin=(1.0, 1.0),
+            episode_lengths=episode_length,
+            reference_state="dummy_state_0",
+            dtype=dtype,
+        )
+        test_object.set_modules(physical_system)
+        # Without numba, the kernel of the compiled path runs as plain python function
+        monkeypatch.setattr(steprg, "NUMBA_AVAILABLE", compiled)
+        test_object._random_generator = np.random.default_rng(seed)
+        test_object._reset_reference()
+        # draw the same parameters and compute the phase shift with np.roll
+        rg = np.random.default_rng(seed)
+        amplitude = (0.8 - 0.1) * rg.uniform() + 0.1
+        frequency = (2000 - 1) * rg.uniform() + 1
+        offset_range = np.clip((-0.5, 0.5), -1 + amplitude, 1 - amplitude)
+        offset = (offset_range[1] - offset_range[0]) * rg.uniform() + offset_range[0]
+        high_low_ratio = rg.triangular(0, 0.5, 1)
+        t = np.linspace(0, (episode_length - 1) * tau, episode_length)
+        x = np.where(frequency * (t % (1 / frequency)) >= high_low_ratio, amplitude, -amplitude)
+        x = np.roll(x + offset, int(1 / frequency / tau * rg.uniform()))
+        expected_reference = np.clip(x, -1, 1).astype(dtype)
+        assert test_object._reference.dtype == dtype
+        assert np.array_equal(test_object._reference, expected_reference), "unexpected reference"
+
+    def test_step_reference_buffer(self):
+        test_object = StepReferenceGenerator(episode_lengths=(10, 20), reference_state="dummy_state_0")
+        test_object.set_modules(DummyPhysicalSystem(state_length=2))
+        assert len(test_object._reference_buffer) == 20
+        test_object._current_episode_length = 15
+        test_object._reset_reference()
+        assert len(test_object._reference) == 15
+        assert np.shares_memory(test_object._reference, test_object._reference_buffer)
+        # Longer sub episodes than prepared (e.g. after changing the episode lengths) enlarge the buffer
+        test_object._current_episode_length = 25
+        test_object._reset_reference()
+        assert len(test_object._reference) == 25 and len(test_object._reference_buffer) == 25
+
 
 class TestSubepisodedReferenceGenerator:
     """
@@ -805,6 +894,10 @@ class TestSubepisodedReferenceGenerator:
         reference = test_object.get_reference()
         # verify the expected results
         assert all(reference == np.array([0, 0.4, 0])), "unexpected reference"
+        # the returned references are independent of each other
+        reference[0] = 1.0
+        monkeypatch.setattr(test_object, "_reference_value", -0.2)
+        assert all(test_object.get_reference() == np.array([0, -0.2, 0])), "unexpected reference"
 
     @pytest.mark.parametrize(
         "k, expected_reference, expected_parameter",
@@ -216,3 +216,17 @@ class TestWeightedSumOfErrors(TestRewardFunction):
         rf = self.class_to_test(reward_weights=reward_weights, bias=bias, violation_reward=violation_reward)
         rf.set_modules(ps, rg, cm)
         assert rf.reward(state, reference, violation_degree=violation_degree) == expected_rw
+
+    @pytest.mark.parametrize("reward_power", [1, [1, 2, 1], 0.5])
+    def test_linear_reward(self, reward_power):
+        ps = DummyPhysicalSystem(state_length=3)
+        rg = DummyReferenceGenerator()
+        rg.set_modules(ps)
+        rf = self.class_to_test(reward_weights=[1, 2, 0.5], reward_power=reward_power, bias=1.0)
+        rf.set_modules(ps, rg, DummyConstraintMonitor())
+        state = np.array([0.5, -0.25, 1.0])
+        reference = np.array([-0.5, 0.25, 0.0])
+        n = np.broadcast_to(np.array(reward_power), 3)
+        expected = 1.0 - np.sum(np.array([1, 2, 0.5]) * (abs(state - reference) / rf._state_length) ** n)
+        assert rf._linear == np.all(n == 1)
+        assert np.isclose(rf.reward(state, reference), expected)
@@ -1,3 +1,5 @@
+import functools
+
 import pytest
 import gym_electric_motor.utils as utils
 import gym_electric_motor.core as core
@@ -54,3 +56,29 @@ def test_set_state_array(input_values, state_names, target):
 def test_set_state_array_exceptions(input_values, state_names, error):
     with pytest.raises(error):
         utils.set_state_array(input_values, state_names)
+
+
+def test_initialize():
+    default = utils.initialize(core.RewardFunction, None, dummies.DummyRewardFunction, dict())
+    assert type(default) is dummies.DummyRewardFunction
+    instance = dummies.DummyRewardFunction()
+    assert utils.initialize(core.RewardFunction, instance, dummies.DummyRewardFunction, dict()) is instance
+    updated = utils.initialize(core.RewardFunction, dict(observed_states=["a"]), dummies.DummyRewardFunction, dict())
+    assert type(updated) is dummies.DummyRewardFunction
+    assert updated.kwargs == dict(observed_states=["a"])
+    visualizations = [dummies.DummyVisualization()]
+    assert (
+        utils.initialize((core.ElectricMotorVisualization, list, tuple), visualizations, dummies.DummyVisualization, {})
+        is visualizations
+    )
+    with pytest.raises(Exception, match="deprecated since version 3.0.0"):
+        utils.initialize(core.RewardFunction, "Dummy", dummies.DummyRewardFunction, dict())
+    # The environments pass partials as default classes and tuples as base classes
+    with pytest.raises(Exception, match="default DummyRewardFunction instead"):
+        utils.initialize(
+            core.RewardFunction, "Dummy", functools.partial(dummies.DummyRewardFunction, observed_states=["a"]), dict()
+        )
+    with pytest.raises(Exception, match="the ElectricMotorVisualization/list/tuple by the string"):
+        utils.initialize((core.ElectricMotorVisualization, list, tuple), "Dummy", dummies.DummyVisualization, dict())
+    with pytest.raises(Exception):
+        utils.initialize(core.RewardFunction, dummies.DummyRewardFunction, dummies.DummyRewardFunction, dict())